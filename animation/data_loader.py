@@ -16,6 +16,10 @@ except ImportError:
     HAS_PYREADR = False
 
 
+# Width of the time bins observations are aggregated into
+TIME_GROUP_SECONDS = 300
+
+
 class ProcessedData(NamedTuple):
     animation_data: pd.DataFrame
     wind_summary: pd.DataFrame
@@ -34,6 +38,57 @@ def load_rds_data(filepath: str) -> pd.DataFrame:
     return df
 
 
+def date_mask(timestamps: pd.Series, target_date: str) -> np.ndarray:
+    """Boolean mask selecting timestamps that fall on target_date.
+
+    Compares the raw datetime64 values against the day's bounds instead of
+    materializing a Python date object per row.
+
+    Args:
+        timestamps: Datetime series (NaT entries never match)
+        target_date: Date string in YYYY-MM-DD format
+    """
+    if timestamps.dt.tz is not None:
+        # Compare in local wall-clock time, matching Series.dt.date
+        timestamps = timestamps.dt.tz_localize(None)
+
+    values = timestamps.to_numpy()
+    day_start = np.datetime64(target_date, 'D')
+    return (values >= day_start) & (values < day_start + np.timedelta64(1, 'D'))
+
+
+def split_by_date(df: pd.DataFrame) -> dict:
+    """Split rows into one DataFrame per date in a single grouping pass.
+
+    Args:
+        df: DataFrame with a parsed 'timestamp' column (rows with NaT are dropped)
+
+    Returns:
+        Dict of YYYY-MM-DD string to that date's rows, in date order
+    """
+    timestamps = df['timestamp']
+    if timestamps.dt.tz is not None:
+        timestamps = timestamps.dt.tz_localize(None)
+
+    days = timestamps.to_numpy().astype('datetime64[D]')
+    return {pd.Timestamp(day).strftime('%Y-%m-%d'): day_df
+            for day, day_df in df.groupby(days, sort=True)}
+
+
+def time_group_bins(timestamps: pd.Series) -> np.ndarray:
+    """Integer 5-minute bin index for each timestamp.
+
+    Grouping on int64 keys hashes faster than grouping on floored timestamps.
+    """
+    seconds = timestamps.to_numpy().astype('datetime64[s]').astype(np.int64)
+    return seconds // TIME_GROUP_SECONDS
+
+
+def time_group_starts(bins: pd.Series) -> np.ndarray:
+    """Convert bin indexes from time_group_bins back to bin start datetimes."""
+    return (bins.to_numpy() * TIME_GROUP_SECONDS).astype('datetime64[s]')
+
+
 def process_data(df: pd.DataFrame, target_date: str, site_config: 'SiteConfig',
                  pollution_type: 'PollutionType') -> ProcessedData:
     """Process raw data for animation.
@@ -61,8 +116,7 @@ def process_data(df: pd.DataFrame, target_date: str, site_config: 'SiteConfig',
     df['timestamp'] = pd.to_datetime(df[timestamp_col])
 
     # Filter to target date
-    target = pd.to_datetime(target_date).date()
-    df = df[df['timestamp'].dt.date == target].copy()
+    df = df[date_mask(df['timestamp'], target_date)].copy()
 
     print(f"Filtered data for {target_date} ({site_config.display_name} - {pollution_type.display_name}):")
     print(f"  Total observations: {len(df)}")
@@ -70,8 +124,8 @@ def process_data(df: pd.DataFrame, target_date: str, site_config: 'SiteConfig',
     if len(df) == 0:
         raise ValueError(f"No data found for date {target_date}")
 
-    # Create time groups (round to 5 minutes)
-    df['time_group'] = df['timestamp'].dt.floor('5min')
+    # Create time groups (round to 5 minutes), as integer bins until aggregated
+    df['time_group'] = time_group_bins(df['timestamp'])
 
     # Use configured pollution column
     pollution_col = pollution_type.column
@@ -81,8 +135,9 @@ def process_data(df: pd.DataFrame, target_date: str, site_config: 'SiteConfig',
 
     df['pollution'] = pd.to_numeric(df[pollution_col], errors='coerce')
 
-    # Get sensor coordinates as dict for lookup
-    sensor_dict = {s.sensor: (s.lat, s.lon) for s in site_config.sensors}
+    # Get sensor coordinates as dicts for lookup
+    sensor_lats = {s.sensor: s.lat for s in site_config.sensors}
+    sensor_lons = {s.sensor: s.lon for s in site_config.sensors}
 
     # Use configured sensor ID column
     sensor_col = col_map.sensor_id
@@ -98,8 +153,8 @@ def process_data(df: pd.DataFrame, target_date: str, site_config: 'SiteConfig',
     # Use sensor ID to get lat/lon from config (more reliable than data columns)
     if sensor_col:
         df['sensor_id'] = df[sensor_col]
-        df['lat'] = df[sensor_col].map(lambda x: sensor_dict.get(x, (None, None))[0])
-        df['lon'] = df[sensor_col].map(lambda x: sensor_dict.get(x, (None, None))[1])
+        df['lat'] = df[sensor_col].map(sensor_lats)
+        df['lon'] = df[sensor_col].map(sensor_lons)
     else:
         # Fallback to lat/lon columns in data or config
         if col_map.geo_lat and col_map.geo_lat in df.columns:
@@ -132,6 +187,7 @@ def process_data(df: pd.DataFrame, target_date: str, site_config: 'SiteConfig',
     animation_data = df.groupby(group_cols).agg({
         'pollution': 'mean'
     }).reset_index()
+    animation_data['time_group'] = time_group_starts(animation_data['time_group'])
 
     # Process wind data using configured columns
     wind_dir_col = col_map.wind_dir
@@ -167,6 +223,7 @@ def process_data(df: pd.DataFrame, target_date: str, site_config: 'SiteConfig',
             wind_speed_col: 'mean',
         }).reset_index()
         wind_summary.columns = ['time_group', 'avg_wind_u', 'avg_wind_v', 'avg_wind_speed']
+        wind_summary['time_group'] = time_group_starts(wind_summary['time_group'])
     elif wind_dir_col in df.columns and wind_speed_col:
         # Compute U/V from direction and speed
         wind_data = df.groupby('time_group').agg({
@@ -174,6 +231,7 @@ def process_data(df: pd.DataFrame, target_date: str, site_config: 'SiteConfig',
             wind_speed_col: 'mean',
         }).reset_index()
         wind_data.columns = ['time_group', 'avg_wind_dir', 'avg_wind_speed']
+        wind_data['time_group'] = time_group_starts(wind_data['time_group'])
         # Convert direction to U/V (meteorological convention: direction wind is FROM)
         wind_dir_rad = np.radians(wind_data['avg_wind_dir'])
         wind_data['avg_wind_u'] = -wind_data['avg_wind_speed'] * np.sin(wind_dir_rad)
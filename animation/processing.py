@@ -9,83 +9,135 @@ import numpy as np
 from typing import NamedTuple, Optional, TYPE_CHECKING
 import math
 
+from data_loader import date_mask
+
 if TYPE_CHECKING:
     from site_config import SiteConfig, PollutionType
 
 
+class SensorArrays(NamedTuple):
+    """Per-sensor values for one frame, one array entry per sensor."""
+    lons: np.ndarray
+    lats: np.ndarray
+    pollution: np.ndarray
+    wind_dir: np.ndarray
+    wind_speed: np.ndarray
+    sensor_ids: list
+
+
 class FrameData(NamedTuple):
     """Frame data with sensor pollution and wind vectors."""
     timestamp: pd.Timestamp
     date_label: str
     time_label: str
 
-    # Per-sensor data: [(lon, lat, pollution, wind_dir, wind_speed, sensor_id), ...]
-    sensors: list
+    # Per-sensor data as parallel arrays
+    sensors: SensorArrays
 
+    # Weather station wind shown in the map center (NaN when unavailable)
+    station_wind_dir: float
+    station_wind_speed: float
 
-def gaussian_kernel_smooth(times: np.ndarray, values: np.ndarray,
-                           target_times: np.ndarray, sigma_minutes: float = 10.0) -> np.ndarray:
-    """Apply Gaussian kernel smoothing to time series data."""
-    sigma_seconds = sigma_minutes * 60
-    smoothed = np.zeros(len(target_times))
 
-    for i, t in enumerate(target_times):
-        time_diffs = np.abs(times - t)
+# Upper bound on (target time x sample) weight matrix entries held at once
+MAX_WEIGHT_ELEMENTS = 1 << 22
+
+
+def kernel_weighted_sums(times: np.ndarray, values: np.ndarray, target_times: np.ndarray,
+                         sigma_seconds: float) -> tuple:
+    """Gaussian-weighted sums of sample columns around each target time.
+
+    Samples further than 3 sigma from a target time get zero weight. Target
+    times are processed in blocks so the weight matrix stays bounded.
+
+    Args:
+        times: Sample times in seconds, shape (n,)
+        values: Sample values, shape (n, k)
+        target_times: Times to evaluate at in seconds, shape (m,)
+        sigma_seconds: Gaussian kernel width in seconds
+
+    Returns:
+        (sums, weight_totals, nearest): weighted sums of shape (m, k), total
+        weight per target time, and the index of the nearest sample to each
+        target time (for targets with no samples in range)
+    """
+    n_targets = len(target_times)
+    sums = np.empty((n_targets, values.shape[1]))
+    weight_totals = np.empty(n_targets)
+    nearest = np.empty(n_targets, dtype=np.intp)
+
+    block = max(1, MAX_WEIGHT_ELEMENTS // max(1, len(times)))
+    for start in range(0, n_targets, block):
+        stop = start + block
+        time_diffs = np.abs(times[np.newaxis, :] - target_times[start:stop, np.newaxis])
         weights = np.exp(-0.5 * (time_diffs / sigma_seconds) ** 2)
+        weights[time_diffs >= 3 * sigma_seconds] = 0.0
 
-        mask = time_diffs < 3 * sigma_seconds
-        if mask.sum() > 0:
-            smoothed[i] = np.average(values[mask], weights=weights[mask])
-        else:
-            nearest_idx = np.argmin(time_diffs)
-            smoothed[i] = values[nearest_idx]
+        sums[start:stop] = weights @ values
+        weight_totals[start:stop] = weights.sum(axis=1)
+        nearest[start:stop] = time_diffs.argmin(axis=1)
 
-    return smoothed
+    return sums, weight_totals, nearest
 
 
-def circular_mean(directions: np.ndarray, weights: np.ndarray = None) -> float:
-    """Calculate circular mean of wind directions (in degrees)."""
-    if len(directions) == 0:
-        return 0.0
+def gaussian_kernel_smooth(times: np.ndarray, values: np.ndarray,
+                           target_times: np.ndarray, sigma_minutes: float = 10.0) -> np.ndarray:
+    """Apply Gaussian kernel smoothing to time series data.
 
-    # Convert to radians
-    rads = np.radians(directions)
+    All target times are evaluated together as a weight-matrix product
+    rather than one weighted average per target time.
+    """
+    sigma_seconds = sigma_minutes * 60
 
-    if weights is None:
-        weights = np.ones(len(directions))
+    # Sampled exactly at the target times, and too sparsely for neighbours to
+    # reach each other: every target only sees its own sample
+    if (times.shape == target_times.shape and np.array_equal(times, target_times)
+            and (len(times) < 2 or np.diff(times).min() >= 3 * sigma_seconds)):
+        return values.astype(np.float64)
 
-    # Calculate weighted mean of sin and cos components
-    sin_sum = np.sum(weights * np.sin(rads))
-    cos_sum = np.sum(weights * np.cos(rads))
+    # A constant series smooths to itself
+    if len(values) > 0 and np.all(values == values[0]):
+        return np.full(len(target_times), values[0], dtype=np.float64)
 
-    # Convert back to degrees
-    mean_rad = np.arctan2(sin_sum, cos_sum)
-    mean_deg = np.degrees(mean_rad)
+    sums, weight_totals, nearest = kernel_weighted_sums(
+        times, values[:, np.newaxis], target_times, sigma_seconds
+    )
+
+    # No samples within range: fall back to the nearest raw value
+    smoothed = values[nearest].astype(np.float64)
+    in_range = weight_totals > 0
+    smoothed[in_range] = sums[in_range, 0] / weight_totals[in_range]
+
+    return smoothed
 
-    if mean_deg < 0:
-        mean_deg += 360
 
-    return mean_deg
+def smooth_wind(times: np.ndarray, speeds: np.ndarray, directions: np.ndarray,
+                target_times: np.ndarray, sigma_minutes: float = 10.0) -> tuple:
+    """Smooth wind speed and direction sampled at the same times.
 
+    Speed and the sin/cos components of direction are stacked as columns of
+    one matrix, so a single weight matrix serves all three.
 
-def smooth_wind_direction(times: np.ndarray, directions: np.ndarray,
-                          target_times: np.ndarray, sigma_minutes: float = 10.0) -> np.ndarray:
-    """Apply Gaussian kernel smoothing to wind direction (circular variable)."""
+    Returns:
+        (smoothed_speed, smoothed_direction) arrays at target_times
+    """
     sigma_seconds = sigma_minutes * 60
-    smoothed = np.zeros(len(target_times))
 
-    for i, t in enumerate(target_times):
-        time_diffs = np.abs(times - t)
-        weights = np.exp(-0.5 * (time_diffs / sigma_seconds) ** 2)
+    rads = np.radians(directions)
+    columns = np.column_stack([speeds, np.sin(rads), np.cos(rads)])
+    sums, weight_totals, nearest = kernel_weighted_sums(times, columns, target_times, sigma_seconds)
 
-        mask = time_diffs < 3 * sigma_seconds
-        if mask.sum() > 0:
-            smoothed[i] = circular_mean(directions[mask], weights[mask])
-        else:
-            nearest_idx = np.argmin(time_diffs)
-            smoothed[i] = directions[nearest_idx]
+    empty = weight_totals == 0
+    in_range = ~empty
 
-    return smoothed
+    smoothed_speed = speeds[nearest].astype(np.float64)
+    smoothed_speed[in_range] = sums[in_range, 0] / weight_totals[in_range]
+
+    smoothed_dir = np.degrees(np.arctan2(sums[:, 1], sums[:, 2]))
+    smoothed_dir[smoothed_dir < 0] += 360
+    smoothed_dir[empty] = directions[nearest[empty]]
+
+    return smoothed_speed, smoothed_dir
 
 
 def process_day(df: pd.DataFrame, target_date: str, site_config: 'SiteConfig',
@@ -109,14 +161,14 @@ def process_day(df: pd.DataFrame, target_date: str, site_config: 'SiteConfig',
     col_map = site_config.column_mapping
 
     # Filter to target date
-    target = pd.to_datetime(target_date).date()
-    df = df[df['timestamp'].dt.date == target].copy()
+    df = df[date_mask(df['timestamp'], target_date)].copy()
 
     if len(df) == 0:
         return []
 
     # Get sensor info from config
-    sensor_dict = {s.sensor: (s.lat, s.lon) for s in site_config.sensors}
+    sensor_lats = {s.sensor: s.lat for s in site_config.sensors}
+    sensor_lons = {s.sensor: s.lon for s in site_config.sensors}
 
     # Find and map sensor ID column
     sensor_col = col_map.sensor_id
@@ -129,8 +181,8 @@ def process_day(df: pd.DataFrame, target_date: str, site_config: 'SiteConfig',
             raise ValueError(f"Could not find sensor ID column '{col_map.sensor_id}' in data")
 
     df['sensor_id'] = df[sensor_col]
-    df['lat'] = df['sensor_id'].map(lambda x: sensor_dict.get(x, (None, None))[0])
-    df['lon'] = df['sensor_id'].map(lambda x: sensor_dict.get(x, (None, None))[1])
+    df['lat'] = df['sensor_id'].map(sensor_lats)
+    df['lon'] = df['sensor_id'].map(sensor_lons)
 
     # Pollution column from config
     pollution_col = pollution_type.column
@@ -196,85 +248,95 @@ def process_day(df: pd.DataFrame, target_date: str, site_config: 'SiteConfig',
         freq=f'{int(frame_interval_minutes)}min'
     )
 
-    # Process each sensor's time series
-    sensors = df['sensor_id'].unique()
-    sensor_data = {}
+    target_times_numeric = frame_times.astype(np.int64).to_numpy() / 1e9
+
+    # Per-sensor series are written straight into preallocated (frame, sensor)
+    # matrices so each frame's values are a contiguous row
+    # One pass splits the rows by sensor (in order of first appearance)
+    sensor_groups = df.groupby('sensor_id', sort=False, observed=True)
+    n_sensors = sensor_groups.ngroups
+    n_frames = len(frame_times)
+    sensor_ids = []
+    lons = np.empty(n_sensors)
+    lats = np.empty(n_sensors)
+    pollution = np.empty((n_frames, n_sensors))
+    wind_dir = np.zeros((n_frames, n_sensors))
+    wind_speed = np.zeros((n_frames, n_sensors))
 
-    for sensor in sensors:
-        sensor_df = df[df['sensor_id'] == sensor].sort_values('timestamp')
+    for sensor, sensor_df in sensor_groups:
+        sensor_df = sensor_df.sort_values('timestamp')
 
         if len(sensor_df) < 3:
             continue
 
+        col = len(sensor_ids)
+        sensor_ids.append(sensor)
+
         times_numeric = sensor_df['timestamp'].astype(np.int64) / 1e9
-        target_times_numeric = frame_times.astype(np.int64) / 1e9
 
         # Smooth pollution values
-        smoothed_pollution = gaussian_kernel_smooth(
+        pollution[:, col] = gaussian_kernel_smooth(
             times_numeric.values,
             sensor_df['pollution'].values,
-            target_times_numeric.values,
+            target_times_numeric,
             sigma_minutes=smoothing_sigma_minutes
         )
 
         # Get coordinates
-        lat = sensor_df['lat'].iloc[0]
-        lon = sensor_df['lon'].iloc[0]
+        lats[col] = sensor_df['lat'].iloc[0]
+        lons[col] = sensor_df['lon'].iloc[0]
 
-        # Process wind data for this sensor
+        # Process wind data for this sensor (left at zero when there is none)
         wind_df = sensor_df.dropna(subset=['wind_dir', 'wind_speed'])
 
         if len(wind_df) > 0:
             wind_times = wind_df['timestamp'].astype(np.int64) / 1e9
 
-            # Smooth wind speed (linear)
-            smoothed_wind_speed = gaussian_kernel_smooth(
-                wind_times.values, wind_df['wind_speed'].values,
-                target_times_numeric.values, sigma_minutes=smoothing_sigma_minutes
+            # Smooth wind speed (linear) and direction (circular) together
+            wind_speed[:, col], wind_dir[:, col] = smooth_wind(
+                wind_times.values, wind_df['wind_speed'].values, wind_df['wind_dir'].values,
+                target_times_numeric, sigma_minutes=smoothing_sigma_minutes
             )
 
-            # Smooth wind direction (circular)
-            smoothed_wind_dir = smooth_wind_direction(
-                wind_times.values, wind_df['wind_dir'].values,
-                target_times_numeric.values, sigma_minutes=smoothing_sigma_minutes
-            )
-        else:
-            smoothed_wind_speed = np.zeros(len(frame_times))
-            smoothed_wind_dir = np.zeros(len(frame_times))
+    if len(sensor_ids) == 0:
+        return []
 
-        sensor_data[sensor] = {
-            'lat': lat,
-            'lon': lon,
-            'pollution': smoothed_pollution,
-            'wind_dir': smoothed_wind_dir,
-            'wind_speed': smoothed_wind_speed
-        }
+    # Drop columns reserved for sensors with too few samples
+    n_kept = len(sensor_ids)
+    if n_kept < n_sensors:
+        lons, lats = lons[:n_kept], lats[:n_kept]
+        pollution = pollution[:, :n_kept].copy()
+        wind_dir = wind_dir[:, :n_kept].copy()
+        wind_speed = wind_speed[:, :n_kept].copy()
+
+    # Station wind per frame: every sensor carries the same station data, so
+    # take the first sensor with a wind speed
+    has_speed = ~np.isnan(wind_speed)
+    first = has_speed.argmax(axis=1)
+    rows = np.arange(n_frames)
+    has_wind = has_speed.any(axis=1)
+    station_wind_dir = np.where(has_wind, wind_dir[rows, first], np.nan).tolist()
+    station_wind_speed = np.where(has_wind, wind_speed[rows, first], np.nan).tolist()
 
     # Build frame data
     frames = []
     date_label = pd.to_datetime(target_date).strftime("%B %d, %Y")
 
     for i, frame_time in enumerate(frame_times):
-        sensors_list = []
-
-        for sensor_id, data in sensor_data.items():
-            sensors_list.append((
-                data['lon'],
-                data['lat'],
-                data['pollution'][i],
-                data['wind_dir'][i],
-                data['wind_speed'][i],
-                sensor_id
-            ))
-
-        if len(sensors_list) == 0:
-            continue
-
         frames.append(FrameData(
             timestamp=frame_time,
             date_label=date_label,
             time_label=frame_time.strftime("%H:%M"),
-            sensors=sensors_list
+            sensors=SensorArrays(
+                lons=lons,
+                lats=lats,
+                pollution=pollution[i],
+                wind_dir=wind_dir[i],
+                wind_speed=wind_speed[i],
+                sensor_ids=sensor_ids,
+            ),
+            station_wind_dir=station_wind_dir[i],
+            station_wind_speed=station_wind_speed[i],
         ))
 
     return frames
@@ -293,15 +355,12 @@ def process_day_legacy(df: pd.DataFrame, target_date: str, sensor_coords: list,
 
 def get_pollution_stats(frames: list) -> dict:
     """Get min/max pollution across all frames for consistent scaling."""
-    all_pollution = []
-    for frame in frames:
-        for sensor in frame.sensors:
-            all_pollution.append(sensor[2])  # pollution value
-
-    if len(all_pollution) == 0:
+    if len(frames) == 0:
         return {'min': 0, 'max': 100000}
 
+    all_pollution = np.concatenate([frame.sensors.pollution for frame in frames])
+
     return {
-        'min': min(all_pollution),
-        'max': max(all_pollution)
+        'min': float(all_pollution.min()),
+        'max': float(all_pollution.max())
     }
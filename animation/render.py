@@ -35,40 +35,37 @@ Usage:
 
     # Keep frames after video creation (for debugging)
     uv run python render.py --keep-frames
+
+    # Pipe frames straight into ffmpeg (no frame PNGs on disk)
+    uv run python render.py --stream
+
+    # Re-render even if the video is already up to date
+    uv run python render.py --force
 """
 
 import argparse
+import hashlib
+import json
 import time
 import shutil
+import tempfile
 from pathlib import Path
 import subprocess
 import pandas as pd
+from dataclasses import asdict
 from datetime import datetime, timedelta
 from collections import defaultdict
+from functools import lru_cache
 
 from site_config import get_site_config, list_available_sites, SiteConfig, PollutionType
-from data_loader import load_rds_data
+from data_loader import load_rds_data, split_by_date
 from map_tiles import create_base_map
 from processing import process_day, get_pollution_stats
 from renderer import Renderer
 
 
-def get_available_dates(df: pd.DataFrame, site_config: SiteConfig) -> list:
-    """Get list of dates with data."""
-    timestamp_col = site_config.column_mapping.timestamp
-    if timestamp_col not in df.columns:
-        # Fallback search
-        for col in ['timestamp_local.x', 'timestamp_local.y', 'timestamp_local', 'timestamp', 'valid']:
-            if col in df.columns:
-                timestamp_col = col
-                break
-        else:
-            raise ValueError(f"Could not find timestamp column")
-
-    df['timestamp'] = pd.to_datetime(df[timestamp_col], errors='coerce')
-    df = df.dropna(subset=['timestamp'])
-    dates = sorted(df['timestamp'].dt.date.unique())
-    return [str(d) for d in dates]
+# Target video bitrate in Mbit/s (peak is capped a third above it)
+DEFAULT_BITRATE_MBPS = 6.0
 
 
 def group_dates_by_week(dates: list) -> dict:
@@ -89,36 +86,90 @@ def group_dates_by_week(dates: list) -> dict:
     return {k: sorted(v) for k, v in sorted(weeks.items())}
 
 
-def create_video(frame_dir: str, output_file: str, frame_rate: float = 2.0):
-    """Create video from frames using hardware encoding."""
+@lru_cache(maxsize=1)
+def video_encoder() -> str:
+    """Hardware encoder to use, probed from ffmpeg once per run.
+
+    Prefers HEVC and falls back to H.264 when this ffmpeg build lacks
+    hevc_videotoolbox, so later videos don't each retry a failing encoder.
+    """
+    result = subprocess.run(['ffmpeg', '-hide_banner', '-encoders'],
+                            capture_output=True, text=True)
+    if 'hevc_videotoolbox' in result.stdout:
+        return 'hevc_videotoolbox'
+    return 'h264_videotoolbox'
+
+
+def encoder_args(encoder: str, bitrate: float = DEFAULT_BITRATE_MBPS) -> list:
+    """ffmpeg output arguments for a VideoToolbox encoder.
+
+    Uses average-bitrate control rather than constant quality (-q:v), which
+    keeps the encode on the hardware media engine; software fallback is
+    disabled so a missing engine fails loudly instead of encoding slowly.
+
+    Args:
+        encoder: ffmpeg encoder name
+        bitrate: Target bitrate in Mbit/s
+    """
+    args = ['-c:v', encoder]
+    if encoder == 'hevc_videotoolbox':
+        args += ['-tag:v', 'hvc1']
+    return args + [
+        '-b:v', f'{bitrate:g}M',
+        '-maxrate', f'{bitrate * 4 / 3:g}M',
+        '-bufsize', f'{bitrate * 2:g}M',
+        '-realtime', '0',
+        '-allow_sw', '0',
+        '-pix_fmt', 'yuv420p',
+    ]
+
+
+def create_video(frame_dir: str, output_file: str, frame_rate: float = 2.0,
+                 bitrate: float = DEFAULT_BITRATE_MBPS):
+    """Create video from frames using hardware encoding (bitrate in Mbit/s).
+
+    Returns:
+        True if ffmpeg finished the video, False if the encode failed
+    """
     print(f"\nCreating video: {output_file}")
 
+    # Remove the previous video so a failed encode can't leave it in place
+    Path(output_file).unlink(missing_ok=True)
+
+    encoder = video_encoder()
     cmd = [
         'ffmpeg', '-y',
         '-framerate', str(frame_rate),
         '-i', f'{frame_dir}/frame_%05d.png',
-        '-c:v', 'hevc_videotoolbox',
-        '-tag:v', 'hvc1',
-        '-q:v', '65',
-        '-pix_fmt', 'yuv420p',
+        *encoder_args(encoder, bitrate),
         output_file
     ]
 
     result = subprocess.run(cmd, capture_output=True, text=True)
-    if result.returncode != 0:
+    if result.returncode != 0 and encoder == 'hevc_videotoolbox':
         print(f"  HEVC failed, trying H.264...")
         cmd = [
             'ffmpeg', '-y',
             '-framerate', str(frame_rate),
             '-i', f'{frame_dir}/frame_%05d.png',
-            '-c:v', 'h264_videotoolbox',
-            '-q:v', '65',
-            '-pix_fmt', 'yuv420p',
+            *encoder_args('h264_videotoolbox', bitrate),
             output_file
         ]
-        subprocess.run(cmd, capture_output=True)
+        result = subprocess.run(cmd, capture_output=True, text=True)
+
+    if result.returncode != 0:
+        print(f"  Encode failed (ffmpeg exit code {result.returncode})")
+        for line in result.stderr.strip().splitlines()[-10:]:
+            print(f"    ffmpeg: {line}")
+        Path(output_file).unlink(missing_ok=True)
+        return False
+
+    report_video(output_file)
+    return True
 
-    # Get file size
+
+def report_video(output_file: str):
+    """Print the size of a finished video, or a warning if it is missing."""
     if Path(output_file).exists():
         size_mb = Path(output_file).stat().st_size / (1024 * 1024)
         print(f"  Done: {output_file} ({size_mb:.1f} MB)")
@@ -126,33 +177,126 @@ def create_video(frame_dir: str, output_file: str, frame_rate: float = 2.0):
         print(f"  Warning: Video file not created")
 
 
-def render_animation(site_config: SiteConfig, pollution_type: PollutionType,
-                     df: pd.DataFrame, dates: list, args, video_output_dir: Path = None,
-                     keep_frames: bool = False) -> dict:
-    """Render animation for a specific site and pollution type.
+def start_video_stream(output_file: str, width: int, height: int,
+                       frame_rate: float = 2.0,
+                       bitrate: float = DEFAULT_BITRATE_MBPS) -> tuple:
+    """Start an ffmpeg process that encodes raw BGRA frames written to its stdin.
 
-    Args:
-        video_output_dir: Optional override for where to save the video
-        keep_frames: If False, delete frames after video creation to save disk space
+    Skips writing and re-reading a PNG per frame. Frames aren't kept, so
+    there is no H.264 retry if the HEVC encoder fails at encode time.
 
     Returns:
-        Dictionary with rendering statistics
+        (process, error_log); ffmpeg's stderr goes to the error_log temp file
+        (not a pipe, which could fill up and stall the encode) so a failure
+        can be reported by finish_video_stream
     """
-    print(f"\n{'='*60}")
-    print(f"  {site_config.display_name} - {pollution_type.display_name}")
-    print(f"{'='*60}")
+    print(f"\nStreaming video: {output_file}")
 
-    # Create output directories
-    output_dir = Path(args.output)
-    output_dir.mkdir(parents=True, exist_ok=True)
+    cmd = [
+        'ffmpeg', '-y',
+        '-f', 'rawvideo',
+        '-pixel_format', 'bgra',
+        '-video_size', f'{width}x{height}',
+        '-framerate', str(frame_rate),
+        '-i', '-',
+        *encoder_args(video_encoder(), bitrate),
+        output_file
+    ]
+    error_log = tempfile.TemporaryFile()
+    process = subprocess.Popen(cmd, stdin=subprocess.PIPE,
+                               stdout=subprocess.DEVNULL, stderr=error_log)
+    return process, error_log
 
-    # Use pollution-type-specific frames directory
-    frames_dir = output_dir / f"frames_{site_config.name}_{pollution_type.name}"
-    frames_dir.mkdir(parents=True, exist_ok=True)
 
-    # Clear old frames
-    for old_frame in frames_dir.glob("frame_*.png"):
-        old_frame.unlink()
+def finish_video_stream(process: subprocess.Popen, error_log, output_file: str) -> bool:
+    """Close a video stream's input and wait for ffmpeg to finish the file.
+
+    Returns:
+        True if ffmpeg finished the video, False if the encode failed
+    """
+    try:
+        process.stdin.close()
+    except BrokenPipeError:
+        # ffmpeg already exited; its exit code and log say why
+        pass
+
+    succeeded = process.wait() == 0
+    if not succeeded:
+        print(f"  Streamed encode failed (ffmpeg exit code {process.returncode}); "
+              f"rerun without --stream to fall back to H.264")
+        error_log.seek(0)
+        for line in error_log.read().decode(errors='replace').strip().splitlines()[-10:]:
+            print(f"    ffmpeg: {line}")
+    error_log.close()
+
+    if succeeded:
+        report_video(output_file)
+    return succeeded
+
+
+def abort_video_stream(process: subprocess.Popen, error_log, output_file: str):
+    """Stop a streaming ffmpeg that will not get its remaining frames and drop its output."""
+    process.kill()
+    process.wait()
+    error_log.close()
+    Path(output_file).unlink(missing_ok=True)
+
+
+def config_digest(site_config: SiteConfig, pollution_type: PollutionType) -> str:
+    """Digest of the site and pollution type settings a video is rendered with.
+
+    Covers sensors and their coordinates, the color scale (vis_min/vis_max) and
+    the map extent, so editing site_config.py invalidates existing videos.
+    """
+    site = asdict(site_config)
+    site.pop('pollution_types')  # only the rendered type matters
+    config = {
+        'site': site,
+        'pollution_type': asdict(pollution_type),
+        'map_extent': site_config.get_map_extent(),
+    }
+    return hashlib.sha256(json.dumps(config, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def render_signature(site_config: SiteConfig, pollution_type: PollutionType, args) -> dict:
+    """Inputs a single-video render depends on, used to detect an up-to-date video."""
+    data_file = Path(args.data or site_config.data_file)
+    return {
+        'data_file': str(data_file.resolve()),
+        'data_mtime': data_file.stat().st_mtime,
+        'pollution_type': pollution_type.name,
+        'config': config_digest(site_config, pollution_type),
+        'days': args.days,
+        'width': args.width,
+        'height': args.height,
+        'fps': args.fps,
+        'bitrate': getattr(args, 'bitrate', DEFAULT_BITRATE_MBPS),
+    }
+
+
+def signature_path(video_file) -> Path:
+    """Path of the signature file recorded next to a video."""
+    return Path(video_file).with_suffix('.sig.json')
+
+
+def video_is_current(video_file, signature: dict) -> bool:
+    """Whether video_file exists and was rendered from the same inputs."""
+    sig_file = signature_path(video_file)
+    if not Path(video_file).exists() or not sig_file.exists():
+        return False
+    try:
+        return json.loads(sig_file.read_text()) == signature
+    except (OSError, ValueError):
+        return False
+
+
+def create_renderer(site_config: SiteConfig, pollution_type: PollutionType, args) -> Renderer:
+    """Create a renderer with the site's base map loaded, creating the base map if needed.
+
+    The renderer's worker processes stay up between renders; call close() when done.
+    """
+    output_dir = Path(args.output)
+    output_dir.mkdir(parents=True, exist_ok=True)
 
     # Create base map (shared per site)
     base_map_path = output_dir / f"{site_config.name}_base_map.png"
@@ -169,7 +313,6 @@ def render_animation(site_config: SiteConfig, pollution_type: PollutionType,
     else:
         print(f"\nUsing existing base map: {base_map_path}")
 
-    # Create renderer
     renderer = Renderer(
         width=args.width,
         height=args.height,
@@ -177,53 +320,131 @@ def render_animation(site_config: SiteConfig, pollution_type: PollutionType,
         pollution_type=pollution_type
     )
     renderer.load_base_map(str(base_map_path))
+    return renderer
+
+
+def render_animation(site_config: SiteConfig, pollution_type: PollutionType,
+                     days: dict, dates: list, args, video_output_dir: Path = None,
+                     keep_frames: bool = False, renderer: Renderer = None) -> dict:
+    """Render animation for a specific site and pollution type.
+
+    Args:
+        days: Per-date DataFrames from split_by_date
+        video_output_dir: Optional override for where to save the video
+        keep_frames: If False, delete frames after video creation to save disk space
+        renderer: Renderer from create_renderer to reuse (left open for the caller);
+            one is created and closed here if not given
+
+    Returns:
+        Dictionary with rendering statistics
+    """
+    print(f"\n{'='*60}")
+    print(f"  {site_config.display_name} - {pollution_type.display_name}")
+    print(f"{'='*60}")
+
+    # Create output directories
+    output_dir = Path(args.output)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    stream = getattr(args, 'stream', False)
+    bitrate = getattr(args, 'bitrate', DEFAULT_BITRATE_MBPS)
+
+    # Use pollution-type-specific frames directory (unused when streaming)
+    frames_dir = output_dir / f"frames_{site_config.name}_{pollution_type.name}"
+    if not stream:
+        # Clear old frames by replacing the directory instead of unlinking each file
+        if frames_dir.exists():
+            shutil.rmtree(frames_dir)
+        frames_dir.mkdir(parents=True)
+
+    owns_renderer = renderer is None
+    if owns_renderer:
+        renderer = create_renderer(site_config, pollution_type, args)
+
+    # Video path - use override dir if provided
+    if video_output_dir:
+        video_output_dir.mkdir(parents=True, exist_ok=True)
+        video_file = str(video_output_dir / site_config.get_video_filename(pollution_type))
+    else:
+        video_file = str(output_dir / site_config.get_video_filename(pollution_type))
+
+    video_stream = stream_log = None
+    if stream:
+        video_stream, stream_log = start_video_stream(video_file, args.width, args.height,
+                                                      args.fps, bitrate)
 
     # Render all days
     print("\nRendering frames...")
     frame_count = 1
     day_stats = []
+    stream_broken = False
+    rendered = False
 
-    for date in dates:
-        print(f"\n  {date}...")
-
-        frames = process_day(df, date, site_config, pollution_type)
+    try:
+        for date in dates:
+            print(f"\n  {date}...")
 
-        if len(frames) == 0:
-            print(f"    No frames, skipping")
-            continue
+            day_df = days.get(date)
+            frames = process_day(day_df, date, site_config, pollution_type) if day_df is not None else []
 
-        start_frame = frame_count
-        frame_count = renderer.render_all_frames(frames, str(frames_dir), num_workers=8, start_frame=frame_count)
+            if len(frames) == 0:
+                print(f"    No frames, skipping")
+                continue
 
-        day_stats.append({
-            'date': date,
-            'start': start_frame,
-            'end': frame_count - 1,
-            'count': len(frames)
-        })
+            start_frame = frame_count
+            if video_stream:
+                frame_count = renderer.stream_frames(frames, video_stream.stdin.write, num_workers=8,
+                                                     start_frame=frame_count)
+            else:
+                frame_count = renderer.render_all_frames(frames, str(frames_dir), num_workers=8,
+                                                         start_frame=frame_count)
+
+            day_stats.append({
+                'date': date,
+                'start': start_frame,
+                'end': frame_count - 1,
+                'count': len(frames)
+            })
+        rendered = True
+    except BrokenPipeError:
+        # ffmpeg exited before taking every frame; finish_video_stream reports why
+        print("\n  ffmpeg stopped accepting frames")
+        stream_broken = True
+    finally:
+        if owns_renderer or not rendered:
+            # Also drops a shared renderer's jobs left queued by the interrupted day
+            renderer.close()
+        if stream_broken:
+            finish_video_stream(video_stream, stream_log, video_file)
+        elif video_stream and not rendered:
+            # Rendering failed or was interrupted; don't leave ffmpeg or a partial video behind
+            abort_video_stream(video_stream, stream_log, video_file)
+
+    if stream_broken:
+        return {'total_frames': frame_count - 1, 'video_file': None, 'day_stats': day_stats}
 
     total_frames = frame_count - 1
 
     if total_frames == 0:
         print("  No frames rendered")
+        if video_stream:
+            # Nothing to encode; drop the empty stream's output
+            abort_video_stream(video_stream, stream_log, video_file)
         return {'total_frames': 0, 'video_file': None, 'day_stats': []}
 
     print(f"\n  Total frames: {total_frames}")
 
-    # Create video - use override dir if provided
-    if video_output_dir:
-        video_output_dir.mkdir(parents=True, exist_ok=True)
-        video_file = str(video_output_dir / site_config.get_video_filename(pollution_type))
+    if video_stream:
+        if not finish_video_stream(video_stream, stream_log, video_file):
+            video_file = None
     else:
-        video_file = str(output_dir / site_config.get_video_filename(pollution_type))
-
-    create_video(str(frames_dir), video_file, frame_rate=args.fps)
+        if not create_video(str(frames_dir), video_file, frame_rate=args.fps, bitrate=bitrate):
+            video_file = None
 
     # Clean up frames to save disk space (unless --keep-frames was specified)
-    if not keep_frames and frames_dir.exists():
-        frame_count_deleted = len(list(frames_dir.glob("frame_*.png")))
+    if not stream and not keep_frames and frames_dir.exists():
         shutil.rmtree(frames_dir)
-        print(f"  Cleaned up {frame_count_deleted} frames to save disk space")
+        print(f"  Cleaned up {total_frames} frames to save disk space")
 
     return {
         'total_frames': total_frames,
@@ -232,10 +453,16 @@ def render_animation(site_config: SiteConfig, pollution_type: PollutionType,
     }
 
 
-def render_weekly(site_config: SiteConfig, pollution_types: list, df: pd.DataFrame,
+def render_weekly(site_config: SiteConfig, pollution_types: list, days: dict,
                   dates: list, args) -> list:
     """Render weekly videos for a site.
 
+    Args:
+        days: Per-date DataFrames from split_by_date
+
+    Each pollution type renders all of its weeks with one renderer, so its
+    worker processes start once rather than once per week.
+
     Output structure:
         output/videos/{site}/week_{YYYY-MM-DD}/{site}_{pollution}.mp4
 
@@ -256,38 +483,47 @@ def render_weekly(site_config: SiteConfig, pollution_types: list, df: pd.DataFra
     all_results = []
     videos_base = Path(args.output) / "videos" / site_config.name
 
-    for week_idx, (week_start, week_dates) in enumerate(weeks.items(), 1):
-        print(f"\n{'#'*60}")
-        print(f"  Week {week_idx}/{total_weeks}: {week_start}")
-        print(f"  Days: {len(week_dates)} ({week_dates[0]} to {week_dates[-1]})")
-        print(f"{'#'*60}")
-
-        # Create week output directory
-        week_dir = videos_base / f"week_{week_start}"
-
-        for pollution_type in pollution_types:
-            # Check if video already exists
-            video_path = week_dir / site_config.get_video_filename(pollution_type)
-            if video_path.exists():
-                print(f"\n  Skipping {pollution_type.name} - video already exists: {video_path}")
-                all_results.append({
-                    'week': week_start,
-                    'pollution_type': pollution_type,
-                    'total_frames': 0,
-                    'video_file': str(video_path),
-                    'skipped': True
-                })
-                continue
-
-            result = render_animation(
-                site_config, pollution_type, df, week_dates, args,
-                video_output_dir=week_dir,
-                keep_frames=getattr(args, 'keep_frames', False)
-            )
-            result['week'] = week_start
-            result['pollution_type'] = pollution_type
-            result['skipped'] = False
-            all_results.append(result)
+    for pollution_type in pollution_types:
+        renderer = None
+        try:
+            for week_idx, (week_start, week_dates) in enumerate(weeks.items(), 1):
+                print(f"\n{'#'*60}")
+                print(f"  Week {week_idx}/{total_weeks}: {week_start}")
+                print(f"  Days: {len(week_dates)} ({week_dates[0]} to {week_dates[-1]})")
+                print(f"{'#'*60}")
+
+                # Create week output directory
+                week_dir = videos_base / f"week_{week_start}"
+
+                # Check if video already exists
+                video_path = week_dir / site_config.get_video_filename(pollution_type)
+                if video_path.exists():
+                    print(f"\n  Skipping {pollution_type.name} - video already exists: {video_path}")
+                    all_results.append({
+                        'week': week_start,
+                        'pollution_type': pollution_type,
+                        'total_frames': 0,
+                        'video_file': str(video_path),
+                        'skipped': True
+                    })
+                    continue
+
+                if renderer is None:
+                    renderer = create_renderer(site_config, pollution_type, args)
+
+                result = render_animation(
+                    site_config, pollution_type, days, week_dates, args,
+                    video_output_dir=week_dir,
+                    keep_frames=getattr(args, 'keep_frames', False),
+                    renderer=renderer
+                )
+                result['week'] = week_start
+                result['pollution_type'] = pollution_type
+                result['skipped'] = False
+                all_results.append(result)
+        finally:
+            if renderer is not None:
+                renderer.close()
 
     return all_results
 
@@ -308,8 +544,14 @@ def main():
     parser.add_argument("--width", type=int, default=2880, help="Frame width")
     parser.add_argument("--height", type=int, default=1920, help="Frame height")
     parser.add_argument("--fps", type=float, default=32.0, help="Frames per second")
+    parser.add_argument("--bitrate", type=float, default=DEFAULT_BITRATE_MBPS,
+                        help="Target video bitrate in Mbit/s")
     parser.add_argument("--keep-frames", action="store_true",
                         help="Keep frame PNGs after video creation (default: delete to save disk space)")
+    parser.add_argument("--stream", action="store_true",
+                        help="Pipe raw frames straight to ffmpeg instead of writing frame PNGs")
+    parser.add_argument("--force", action="store_true",
+                        help="Re-render videos even if they are up to date with their inputs")
     parser.add_argument("--list-sites", action="store_true", help="List available sites and exit")
     parser.add_argument("--all-sites", action="store_true",
                         help="Render all sites (Eastie: single video, ECAGP: weekly videos for all pollution types)")
@@ -393,6 +635,26 @@ def render_site(args):
         # Default: first pollution type
         pollution_types = [site_config.pollution_types[0]]
 
+    # Single-video mode: skip pollution types whose video is already current,
+    # before paying for the data load (weekly mode skips existing videos itself)
+    signatures = {}
+    if not args.weekly:
+        output_dir = Path(args.output)
+        for pollution_type in pollution_types:
+            signatures[pollution_type.name] = render_signature(site_config, pollution_type, args)
+
+        if not getattr(args, 'force', False):
+            current = [pt for pt in pollution_types
+                       if video_is_current(output_dir / site_config.get_video_filename(pt),
+                                           signatures[pt.name])]
+            for pt in current:
+                print(f"Skipping {pt.name} - video is up to date "
+                      f"(use --force to re-render): {output_dir / site_config.get_video_filename(pt)}")
+            pollution_types = [pt for pt in pollution_types if pt not in current]
+            if not pollution_types:
+                print("\nAll videos up to date, nothing to render")
+                return
+
     print(f"Pollution types to render: {', '.join(pt.name for pt in pollution_types)}")
 
     # Load data
@@ -410,11 +672,18 @@ def render_site(args):
                 break
     df['timestamp'] = pd.to_datetime(df[timestamp_col], errors='coerce')
 
-    # Get dates
+    # Split rows by date once; every day is then processed from its own slice
+    # (once per pollution type) instead of filtering the full dataset again
+    days = split_by_date(df)
+
+    # Get dates (normalized to the YYYY-MM-DD keys of days, so e.g. 2025-8-1 matches)
     if args.days:
-        dates = args.days
+        dates = [pd.to_datetime(d).strftime('%Y-%m-%d') for d in args.days]
+        for d in dates:
+            if d not in days:
+                print(f"Warning: no data for {d}")
     else:
-        dates = get_available_dates(df, site_config)
+        dates = list(days)
 
     print(f"\nDays to process: {len(dates)}")
     for d in dates[:5]:  # Show first 5
@@ -424,7 +693,7 @@ def render_site(args):
 
     # Render - weekly or single video
     if args.weekly:
-        all_results = render_weekly(site_config, pollution_types, df, dates, args)
+        all_results = render_weekly(site_config, pollution_types, days, dates, args)
 
         # Summary for weekly
         elapsed = time.time() - total_start
@@ -453,13 +722,20 @@ def render_site(args):
         # Original single-video mode
         all_results = []
         for pollution_type in pollution_types:
+            sig_file = signature_path(output_dir / site_config.get_video_filename(pollution_type))
+            sig_file.unlink(missing_ok=True)
+
             result = render_animation(
-                site_config, pollution_type, df, dates, args,
+                site_config, pollution_type, days, dates, args,
                 keep_frames=getattr(args, 'keep_frames', False)
             )
             result['pollution_type'] = pollution_type
             all_results.append(result)
 
+            # Record what the video was rendered from so an unchanged rerun can skip it
+            if result['video_file'] and Path(result['video_file']).exists():
+                sig_file.write_text(json.dumps(signatures[pollution_type.name], indent=2))
+
         # Summary
         elapsed = time.time() - total_start
 
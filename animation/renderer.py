@@ -8,8 +8,10 @@ Features:
 """
 
 import math
+import threading
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import time
 from typing import TYPE_CHECKING
 
@@ -34,6 +36,7 @@ from Quartz import (
     CGContextStrokePath,
     CGContextAddEllipseInRect,
     CGContextFillPath,
+    CGContextDrawPath,
     CGContextAddRect,
     CGContextDrawImage,
     CGContextSaveGState,
@@ -42,17 +45,25 @@ from Quartz import (
     CGContextSetShouldAntialias,
     CGContextSetInterpolationQuality,
     CGContextClip,
-    CGImageDestinationCreateWithURL,
-    CGImageDestinationAddImage,
-    CGImageDestinationFinalize,
     kCGLineCapRound,
     kCGLineJoinRound,
+    kCGPathFillStroke,
     kCGInterpolationHigh,
     CGColorCreate,
     CGRectMake,
+    CGContextSetTextMatrix,
+    CGAffineTransformMake,
 )
 import CoreFoundation
-from Foundation import NSURL
+from CoreText import (
+    CTFontCreateWithName,
+    CTLineCreateWithAttributedString,
+    CTLineDraw,
+    CTLineGetBoundsWithOptions,
+    kCTFontAttributeName,
+    kCTForegroundColorFromContextAttributeName,
+)
+from Foundation import NSURL, NSAttributedString
 from PIL import Image
 import numpy as np
 
@@ -65,6 +76,26 @@ class Renderer:
     LEFT_MARGIN = 88
     RIGHT_MARGIN = 288
 
+    # Pixel layout for bitmaps and images: premultiplied BGRA, the native format
+    # of Apple GPUs and Quartz, so drawing never needs a channel swizzle
+    BITMAP_INFO = Quartz.kCGImageAlphaPremultipliedFirst | Quartz.kCGBitmapByteOrder32Little
+
+    # Same layout with the alpha byte ignored, for fully opaque images; drawing
+    # them is a plain copy with no blending
+    OPAQUE_BITMAP_INFO = Quartz.kCGImageAlphaNoneSkipFirst | Quartz.kCGBitmapByteOrder32Little
+
+    # Colormap samples in the legend gradient image (smoothly scaled up to the bar height)
+    LEGEND_STEPS = 32
+
+    # Number of entries in the precomputed colormap lookup table
+    COLOR_LUT_SIZE = 1024
+
+    # Frames sent to a worker process at a time
+    FRAMES_PER_JOB = 8
+
+    # Rendered frames allowed to wait for PNG encoding (each holds a full pixel copy)
+    MAX_PENDING_ENCODES = 2
+
     # Plasma colormap
     PLASMA_COLORS = [
         (0.050, 0.030, 0.528), (0.133, 0.022, 0.563), (0.208, 0.020, 0.588),
@@ -79,7 +110,7 @@ class Renderer:
     ]
 
     def __init__(self, width: int, height: int, site_config: 'SiteConfig',
-                 pollution_type: 'PollutionType'):
+                 pollution_type: 'PollutionType', verbose: bool = True):
         """
         Initialize renderer with site and pollution type configuration.
 
@@ -88,7 +119,9 @@ class Renderer:
             height: Frame height in pixels
             site_config: Site configuration object
             pollution_type: Pollution type configuration
+            verbose: Print setup details (off for worker process copies)
         """
+        self.verbose = verbose
         self.width = width
         self.height = height
         self.site_config = site_config
@@ -105,37 +138,127 @@ class Renderer:
         self.circle_max = site_config.circle_max
 
         self.color_space = CGColorSpaceCreateDeviceRGB()
+
+        # CGColors keyed by RGBA components; UI colors are fixed and sensor
+        # colors come from the finite LUT, so the cache stays small
+        self._color_cache = {}
+
+        # CoreText fonts keyed by (bold, size), and laid-out lines for text
+        # that repeats every frame, keyed by (text, bold, size)
+        self._font_cache = {}
+        self._line_cache = {}
+
         self.base_map_image = None
+        self.base_map_path = None
+
+        # Worker processes for render_all_frames, started on first use
+        self._process_pool = None
+        self._process_pool_size = 0
+
+        # Background PNG encoder, started on first use
+        self._encoder_pool = None
+
+        # One reusable bitmap context per worker thread (frames share dimensions)
+        self._context_pool = threading.local()
+
+        # Layers that are identical in every frame, rendered by load_base_map
+        self._static_background = None
+        self._static_background_lock = threading.Lock()
 
         self.map_x = self.LEFT_MARGIN
         self.map_y = self.FOOTER_HEIGHT
         self.map_width = width - self.LEFT_MARGIN - self.RIGHT_MARGIN
         self.map_height = height - self.HEADER_HEIGHT - self.FOOTER_HEIGHT
 
-        print(f"Renderer initialized for {site_config.display_name} - {pollution_type.display_name}")
-        print(f"  Resolution: {width}x{height}")
-        print(f"  Map area: {self.map_width}x{self.map_height}")
-        print(f"  Pollution range: {self.pollution_vis_min} - {self.pollution_vis_max} {pollution_type.unit}")
+        # Mercator bounds of the map extent (constant for the renderer's lifetime)
+        self._merc_lat_min = self.lat_to_mercator(self.map_extent.lat_min)
+        self._merc_lat_max = self.lat_to_mercator(self.map_extent.lat_max)
+
+        # Plasma colormap sampled at COLOR_LUT_SIZE evenly spaced normalized values
+        lut_positions = np.linspace(0, 1, self.COLOR_LUT_SIZE)
+        stop_positions = np.linspace(0, 1, len(self.PLASMA_COLORS))
+        stops = np.array(self.PLASMA_COLORS)
+        self._plasma_lut = np.column_stack([
+            np.interp(lut_positions, stop_positions, stops[:, channel]) for channel in range(3)
+        ])
+
+        # Circle sizes at the same normalized values, so one index gives size and color
+        self._size_lut = self.circle_min + lut_positions * (self.circle_max - self.circle_min)
+
+        self._legend_image = self._build_legend_image()
+
+        if verbose:
+            print(f"Renderer initialized for {site_config.display_name} - {pollution_type.display_name}")
+            print(f"  Resolution: {width}x{height}")
+            print(f"  Map area: {self.map_width}x{self.map_height}")
+            print(f"  Pollution range: {self.pollution_vis_min} - {self.pollution_vis_max} {pollution_type.unit}")
 
     def load_base_map(self, path: str):
-        """Load pre-rendered base map image."""
-        pil_image = Image.open(path).convert('RGBA')
-        pil_image = pil_image.resize((self.map_width, self.map_height), Image.LANCZOS)
+        """Load pre-rendered base map image.
+
+        Decoded with ImageIO; the image is only resampled (by Quartz) if it
+        isn't already at the map size.
+        """
+        source = Quartz.CGImageSourceCreateWithURL(NSURL.fileURLWithPath_(path), None)
+        image = Quartz.CGImageSourceCreateImageAtIndex(source, 0, None) if source is not None else None
+        if image is None:
+            raise ValueError(f"Could not load base map image: {path}")
+
+        # Base maps are normally created at the map size already
+        if (Quartz.CGImageGetWidth(image), Quartz.CGImageGetHeight(image)) != (self.map_width, self.map_height):
+            # Map tiles are opaque
+            ctx = CGBitmapContextCreate(
+                None, self.map_width, self.map_height, 8, self.map_width * 4,
+                self.color_space, self.OPAQUE_BITMAP_INFO
+            )
+            CGContextSetInterpolationQuality(ctx, kCGInterpolationHigh)
+            CGContextDrawImage(ctx, CGRectMake(0, 0, self.map_width, self.map_height), image)
+            image = CGBitmapContextCreateImage(ctx)
+
+        self.base_map_image = image
+        self.base_map_path = path
+        # The static background includes the base map, so rebuild it now rather
+        # than on the first frame
+        self._static_background = self._render_static_background()
+        # Worker processes hold the previous base map
+        self.close()
+        if self.verbose:
+            print(f"  Base map loaded: {path}")
+
+    def _build_legend_image(self):
+        """Build the legend gradient as a 1-pixel-wide image, one row per colormap sample.
+
+        The image is stretched over the legend bar with interpolation, which
+        blends neighbouring samples into a continuous gradient.
+        """
+        band_values = np.linspace(self.pollution_vis_min, self.pollution_vis_max, self.LEGEND_STEPS)
+        pixels = np.full((self.LEGEND_STEPS, 1, 4), 255, dtype=np.uint8)
+        # BGRA channel order
+        pixels[:, 0, :3] = np.rint(self.get_plasma_colors(band_values)[:, ::-1] * 255)
+        # Image rows run top to bottom, while the bar's low values are at the bottom
+        data = pixels[::-1].tobytes()
 
-        data = pil_image.tobytes()
         provider = Quartz.CGDataProviderCreateWithData(None, data, len(data), None)
-        self.base_map_image = Quartz.CGImageCreate(
-            self.map_width, self.map_height, 8, 32, self.map_width * 4,
-            self.color_space, Quartz.kCGImageAlphaPremultipliedLast,
+        image = Quartz.CGImageCreate(
+            1, self.LEGEND_STEPS, 8, 32, 4,
+            self.color_space, self.BITMAP_INFO,
             provider, None, True, Quartz.kCGRenderingIntentDefault
         )
         # Keep reference to prevent garbage collection
-        self._base_map_data = data
-        print(f"  Base map loaded: {path}")
+        self._legend_data = data
+        return image
 
     def create_color(self, r: float, g: float, b: float, a: float = 1.0):
-        """Create a CGColor."""
-        return CGColorCreate(self.color_space, [r, g, b, a])
+        """Get a CGColor, creating it only the first time these components are seen.
+
+        CGColors are immutable, so one instance is shared across frames and threads.
+        """
+        key = (r, g, b, a)
+        color = self._color_cache.get(key)
+        if color is None:
+            color = CGColorCreate(self.color_space, [r, g, b, a])
+            self._color_cache[key] = color
+        return color
 
     def lat_to_mercator(self, lat: float) -> float:
         """Convert latitude to Mercator Y value (normalized)."""
@@ -149,53 +272,98 @@ class Renderer:
 
         # Latitude uses Mercator projection
         merc_lat = self.lat_to_mercator(lat)
-        merc_lat_min = self.lat_to_mercator(self.map_extent.lat_min)
-        merc_lat_max = self.lat_to_mercator(self.map_extent.lat_max)
-        y_ratio = (merc_lat - merc_lat_min) / (merc_lat_max - merc_lat_min)
+        y_ratio = (merc_lat - self._merc_lat_min) / (self._merc_lat_max - self._merc_lat_min)
 
         px = self.map_x + x_ratio * self.map_width
         # Higher latitude = higher y_ratio = higher on map (higher y in Quartz)
         py = self.map_y + y_ratio * self.map_height
         return (px, py)
 
-    def get_plasma_color(self, pollution: float) -> tuple:
-        """Get plasma colormap color for pollution value (normalized to visual range)."""
-        # Normalize to visual range for consistent coloring
-        norm = (pollution - self.pollution_vis_min) / (self.pollution_vis_max - self.pollution_vis_min)
-        norm = max(0, min(1, norm))
-        idx = norm * (len(self.PLASMA_COLORS) - 1)
-        i = int(idx)
-        f = idx - i
-        if i >= len(self.PLASMA_COLORS) - 1:
-            return self.PLASMA_COLORS[-1]
-        c1, c2 = self.PLASMA_COLORS[i], self.PLASMA_COLORS[i + 1]
-        return tuple(c1[j] + f * (c2[j] - c1[j]) for j in range(3))
-
-    def get_circle_size(self, pollution: float) -> float:
-        """Get circle size based on pollution level (normalized to visual range)."""
-        # Normalize to visual range, not data range
+    def geo_to_pixels(self, lons: np.ndarray, lats: np.ndarray) -> tuple:
+        """Vectorized geo_to_pixel: convert coordinate arrays to (xs, ys) pixel arrays."""
+        x_ratio = (lons - self.map_extent.lon_min) / (self.map_extent.lon_max - self.map_extent.lon_min)
+        merc_lats = np.arcsinh(np.tan(np.radians(lats))) / np.pi
+        y_ratio = (merc_lats - self._merc_lat_min) / (self._merc_lat_max - self._merc_lat_min)
+        return self.map_x + x_ratio * self.map_width, self.map_y + y_ratio * self.map_height
+
+    def get_plasma_colors(self, pollution: np.ndarray) -> np.ndarray:
+        """Get plasma colormap colors for an array of pollution values.
+
+        Returns an (n, 3) array of RGB rows; NaN values map to the low end of the scale.
+        """
         norm = (pollution - self.pollution_vis_min) / (self.pollution_vis_max - self.pollution_vis_min)
-        norm = max(0, min(1, norm))
-        size_range = self.circle_max - self.circle_min
-        return self.circle_min + norm * size_range
+        norm = np.nan_to_num(np.clip(norm, 0, 1))
+        idx = (norm * (self.COLOR_LUT_SIZE - 1) + 0.5).astype(np.intp)
+        return self._plasma_lut[idx]
 
-    def draw_label(self, ctx, text: str, x: float, y: float, font_size: float = 12,
-                   bold: bool = True, bg_color=None, padding: float = 4, anchor: str = "center"):
-        """Draw text label with optional background.
+    def sensor_layout(self, sensors) -> tuple:
+        """Pixel positions, circle sizes and colors for all of a frame's sensors.
+
+        Pollution is normalized once (in place) into LUT indexes, and both the
+        size and the color come from the lookup tables at those indexes.
+
+        Returns:
+            (xs, ys, sizes, colors, missing); missing marks NaN pollution, which
+            gets the minimum size
+        """
+        xs, ys = self.geo_to_pixels(sensors.lons, sensors.lats)
+        missing = np.isnan(sensors.pollution)
+
+        norm = sensors.pollution - self.pollution_vis_min
+        norm /= self.pollution_vis_max - self.pollution_vis_min
+        np.clip(norm, 0, 1, out=norm)
+        norm[missing] = 0
+
+        norm *= self.COLOR_LUT_SIZE - 1
+        norm += 0.5
+        idx = norm.astype(np.intp)
+        sizes = self._size_lut[idx]
+        colors = self._plasma_lut[idx]
+
+        return xs, ys, sizes, colors, missing
+
+    def get_font(self, font_size: float, bold: bool):
+        """Get a Helvetica CTFont, creating each size/weight once."""
+        key = (bold, font_size)
+        font = self._font_cache.get(key)
+        if font is None:
+            font_name = "Helvetica-Bold" if bold else "Helvetica"
+            font = CTFontCreateWithName(font_name, font_size, None)
+            self._font_cache[key] = font
+        return font
+
+    def layout_line(self, text: str, font_size: float, bold: bool, cache: bool = False) -> tuple:
+        """Lay out text as a CTLine, returning (line, bounds).
 
         Args:
-            anchor: Text alignment - "left", "center", or "right"
+            cache: Keep the line for reuse; for text that repeats across frames
         """
-        from CoreText import CTFontCreateWithName, CTLineCreateWithAttributedString, CTLineDraw, CTLineGetBoundsWithOptions, kCTFontAttributeName, kCTForegroundColorFromContextAttributeName
-        from Foundation import NSAttributedString
-        from Quartz import CGContextSetTextMatrix, CGAffineTransformMake
+        key = (text, bold, font_size)
+        if cache:
+            cached = self._line_cache.get(key)
+            if cached is not None:
+                return cached
 
-        font_name = "Helvetica-Bold" if bold else "Helvetica"
-        font = CTFontCreateWithName(font_name, font_size, None)
+        font = self.get_font(font_size, bold)
         attrs = {kCTFontAttributeName: font, kCTForegroundColorFromContextAttributeName: True}
         attr_string = NSAttributedString.alloc().initWithString_attributes_(text, attrs)
         line = CTLineCreateWithAttributedString(attr_string)
-        bounds = CTLineGetBoundsWithOptions(line, 0)
+        laid_out = (line, CTLineGetBoundsWithOptions(line, 0))
+
+        if cache:
+            self._line_cache[key] = laid_out
+        return laid_out
+
+    def draw_label(self, ctx, text: str, x: float, y: float, font_size: float = 12,
+                   bold: bool = True, bg_color=None, padding: float = 4, anchor: str = "center",
+                   cache: bool = False):
+        """Draw text label with optional background.
+
+        Args:
+            anchor: Text alignment - "left", "center", or "right"
+            cache: Reuse the laid-out line across frames (for text that doesn't change)
+        """
+        line, bounds = self.layout_line(text, font_size, bold, cache)
 
         if anchor == "center":
             text_x = x - bounds.size.width / 2
@@ -221,13 +389,17 @@ class Renderer:
         CTLineDraw(line, ctx)
         CGContextRestoreGState(ctx)
 
-    def draw_title(self, ctx, date_label: str, time_label: str):
-        """Draw title with site name, pollution type, date and time."""
+    def draw_title(self, ctx):
+        """Draw title with site name and pollution type."""
         title_y = self.height - 56  # More margin from top
         # Include site name in title
         title_text = f"{self.site_config.display_name} — {self.pollution_type.display_name} — {self.pollution_type.unit}"
         self.draw_label(ctx, title_text, self.width / 2, title_y,
                         font_size=32, bold=True, anchor="center")
+
+    def draw_subtitle(self, ctx, date_label: str, time_label: str):
+        """Draw the frame's date and time below the title."""
+        title_y = self.height - 56
         self.draw_label(ctx, f"{date_label}  •  {time_label}", self.width / 2, title_y - 28,
                         font_size=26, bold=False, anchor="center")
 
@@ -243,14 +415,7 @@ class Renderer:
         legend_y = map_center_y - bar_height / 2
 
         # Draw gradient bar using visual range
-        num_steps = 50
-        step_height = bar_height / num_steps
-        for i in range(num_steps):
-            t = i / (num_steps - 1)
-            pollution = self.pollution_vis_min + t * (self.pollution_vis_max - self.pollution_vis_min)
-            color = self.get_plasma_color(pollution)
-            CGContextSetFillColorWithColor(ctx, self.create_color(*color))
-            CGContextFillRect(ctx, CGRectMake(legend_x, legend_y + i * step_height, bar_width, step_height + 1))
+        CGContextDrawImage(ctx, CGRectMake(legend_x, legend_y, bar_width, bar_height), self._legend_image)
 
         # Border
         CGContextSetStrokeColorWithColor(ctx, self.create_color(0.3, 0.3, 0.3))
@@ -502,23 +667,25 @@ class Renderer:
         cone_length = 80 + norm_speed * 60  # 80-140px (shorter, cleaner)
         base_width = 16 + norm_speed * 8  # 16-24px at base
 
+        # Unit direction; the perpendicular (90 degrees counterclockwise) is (-dir_y, dir_x)
+        dir_x = math.cos(angle_rad)
+        dir_y = math.sin(angle_rad)
+
         # Start from edge of circle (with small gap)
         gap = 8
-        start_x = x + (circle_radius + gap) * math.cos(angle_rad)
-        start_y = y + (circle_radius + gap) * math.sin(angle_rad)
+        start_x = x + (circle_radius + gap) * dir_x
+        start_y = y + (circle_radius + gap) * dir_y
 
         # Calculate tip position
-        tip_x = start_x + cone_length * math.cos(angle_rad)
-        tip_y = start_y + cone_length * math.sin(angle_rad)
-
-        # Perpendicular for base width
-        perp_angle = angle_rad + math.pi / 2
+        tip_x = start_x + cone_length * dir_x
+        tip_y = start_y + cone_length * dir_y
 
         # Base corners
-        base1_x = start_x + (base_width / 2) * math.cos(perp_angle)
-        base1_y = start_y + (base_width / 2) * math.sin(perp_angle)
-        base2_x = start_x - (base_width / 2) * math.cos(perp_angle)
-        base2_y = start_y - (base_width / 2) * math.sin(perp_angle)
+        half_width = base_width / 2
+        base1_x = start_x - half_width * dir_y
+        base1_y = start_y + half_width * dir_x
+        base2_x = start_x + half_width * dir_y
+        base2_y = start_y - half_width * dir_x
 
         # === Subtle Drop Shadow ===
         shadow_offset = 3
@@ -531,18 +698,10 @@ class Renderer:
         CGContextClosePath(ctx)
         CGContextFillPath(ctx)
 
-        # === Main Cone - solid clean fill ===
+        # === Main Cone - solid clean fill with a clean white border ===
         cone_color = self.create_color(0.2, 0.4, 0.7, 0.85)
-        CGContextSetFillColorWithColor(ctx, cone_color)
-        CGContextBeginPath(ctx)
-        CGContextMoveToPoint(ctx, base1_x, base1_y)
-        CGContextAddLineToPoint(ctx, tip_x, tip_y)
-        CGContextAddLineToPoint(ctx, base2_x, base2_y)
-        CGContextClosePath(ctx)
-        CGContextFillPath(ctx)
-
-        # === Clean white border ===
         border_color = self.create_color(1, 1, 1, 0.9)
+        CGContextSetFillColorWithColor(ctx, cone_color)
         CGContextSetStrokeColorWithColor(ctx, border_color)
         CGContextSetLineWidth(ctx, 3)
         CGContextSetLineJoin(ctx, kCGLineJoinRound)
@@ -551,25 +710,19 @@ class Renderer:
         CGContextAddLineToPoint(ctx, tip_x, tip_y)
         CGContextAddLineToPoint(ctx, base2_x, base2_y)
         CGContextClosePath(ctx)
-        CGContextStrokePath(ctx)
+        CGContextDrawPath(ctx, kCGPathFillStroke)
 
-    def draw_wind_indicator(self, ctx, sensors):
-        """Draw wind indicator in center of map (from weather station data)."""
-        if not sensors:
-            return
+    def draw_wind_indicator(self, ctx, wind_dir: float, wind_speed: float):
+        """Draw wind indicator in center of map (from weather station data).
 
-        # Get wind from first sensor (all sensors have same station wind data)
-        wind_dir = None
-        wind_speed = None
-        for sensor in sensors:
-            lon, lat, pollution, wd, ws, sensor_id = sensor
-            if not math.isnan(ws) if ws is not None else False:
-                wind_speed = ws
-                wind_dir = wd if (wd is not None and not math.isnan(wd)) else None
-                break
-
-        if wind_speed is None:
+        Args:
+            wind_dir: Station wind direction in degrees (NaN if unknown)
+            wind_speed: Station wind speed in m/s (NaN if unavailable)
+        """
+        if math.isnan(wind_speed):
             return
+        if math.isnan(wind_dir):
+            wind_dir = None
 
         # Check if calm (very low wind)
         is_calm = wind_speed <= 0.1 or wind_dir is None
@@ -581,14 +734,11 @@ class Renderer:
         # Draw background circle
         bg_radius = 72
         CGContextSetFillColorWithColor(ctx, self.create_color(1, 1, 1, 0.85))
-        CGContextAddEllipseInRect(ctx, CGRectMake(center_x - bg_radius, center_y - bg_radius,
-                                                   bg_radius * 2, bg_radius * 2))
-        CGContextFillPath(ctx)
         CGContextSetStrokeColorWithColor(ctx, self.create_color(0.3, 0.3, 0.3, 0.8))
         CGContextSetLineWidth(ctx, 3)
         CGContextAddEllipseInRect(ctx, CGRectMake(center_x - bg_radius, center_y - bg_radius,
                                                    bg_radius * 2, bg_radius * 2))
-        CGContextStrokePath(ctx)
+        CGContextDrawPath(ctx, kCGPathFillStroke)
 
         # Draw wind arrow from center (if not calm)
         if not is_calm:
@@ -600,25 +750,84 @@ class Renderer:
         else:
             speed_label = f"{wind_speed:.1f} m/s"
         self.draw_label(ctx, speed_label, center_x, center_y - 8,
-                       font_size=23, bold=True, bg_color=self.create_color(1, 1, 1, 0.9))
+                       font_size=23, bold=True, bg_color=self.create_color(1, 1, 1, 0.9),
+                       cache=is_calm)
 
         # Label above circle
         self.draw_label(ctx, "Wind Speed", center_x, center_y + bg_radius + 32,
-                       font_size=22, bold=True, bg_color=self.create_color(1, 1, 1, 0.85))
+                       font_size=22, bold=True, bg_color=self.create_color(1, 1, 1, 0.85), cache=True)
         # Station info below circle (from site config)
         station_name = self.site_config.wind_station_name
         station_lat, station_lon = self.site_config.wind_station_coords
         station_label = f"{station_name} ({station_lat:.2f}, {station_lon:.2f})"
         self.draw_label(ctx, station_label, center_x, center_y - bg_radius - 29,
-                       font_size=16, bold=False, bg_color=self.create_color(1, 1, 1, 0.8))
+                       font_size=16, bold=False, bg_color=self.create_color(1, 1, 1, 0.8), cache=True)
 
-    def render_frame(self, frame) -> bytes:
-        """Render a single frame."""
-        ctx = CGBitmapContextCreate(
-            None, self.width, self.height, 8, self.width * 4,
-            self.color_space, Quartz.kCGImageAlphaPremultipliedLast
-        )
+    def _get_context(self) -> tuple:
+        """Get this thread's (bitmap context, pixel buffer), creating them on first use.
+
+        The context draws into a pre-allocated pixel buffer that is reused for
+        every frame rendered on the thread. Each frame starts with an opaque
+        background fill, so no explicit clear is needed between frames.
+        """
+        ctx = getattr(self._context_pool, 'ctx', None)
+        if ctx is None:
+            buffer = np.empty(self.width * self.height * 4, dtype=np.uint8)
+            ctx = CGBitmapContextCreate(
+                buffer, self.width, self.height, 8, self.width * 4,
+                self.color_space, self.BITMAP_INFO
+            )
+            # Quality settings for the context's lifetime; each frame restores
+            # back to this state
+            CGContextSetAllowsAntialiasing(ctx, True)
+            CGContextSetShouldAntialias(ctx, True)
+            CGContextSetInterpolationQuality(ctx, kCGInterpolationHigh)
+            # Keep the buffer alive for as long as the context uses it
+            self._context_pool.buffer = buffer
+            self._context_pool.ctx = ctx
+        return ctx, self._context_pool.buffer
+
+    def render_frames_to_files(self, jobs: list):
+        """Render (frame, path) jobs, encoding each PNG while the next frame draws.
+
+        Encoding runs on a background thread (zlib releases the GIL) from a copy
+        of the pixel buffer, so the pooled context is free for the next frame.
+        Returns once every file is written.
+        """
+        if self._encoder_pool is None:
+            self._encoder_pool = ThreadPoolExecutor(max_workers=1)
 
+        pending = deque()
+        for frame, path in jobs:
+            _, buffer = self._draw_pooled(frame)
+            if len(pending) >= self.MAX_PENDING_ENCODES:
+                pending.popleft().result()
+            pending.append(self._encoder_pool.submit(self.save_pixels, buffer.copy(), path))
+
+        for future in pending:
+            future.result()
+
+    def _draw_pooled(self, frame) -> tuple:
+        """Draw a frame into this thread's pooled context, returning (ctx, buffer).
+
+        The graphics state is saved and restored around the frame so settings
+        like line width and join never carry over into the next frame.
+        """
+        ctx, buffer = self._get_context()
+        CGContextSaveGState(ctx)
+        try:
+            self.draw_frame(ctx, frame)
+        finally:
+            CGContextRestoreGState(ctx)
+        return ctx, buffer
+
+    def render_frame_pixels(self, frame) -> bytes:
+        """Render a single frame and return a copy of its raw BGRA pixels (top row first)."""
+        _, buffer = self._draw_pooled(frame)
+        return buffer.tobytes()
+
+    def draw_static_layers(self, ctx):
+        """Draw everything that doesn't change between frames."""
         CGContextSetAllowsAntialiasing(ctx, True)
         CGContextSetShouldAntialias(ctx, True)
         CGContextSetInterpolationQuality(ctx, kCGInterpolationHigh)
@@ -644,49 +853,93 @@ class Renderer:
         # Draw coordinate labels
         self.draw_coord_labels(ctx)
 
-        # Draw sensor circles first
-        for sensor in frame.sensors:
-            lon, lat, pollution, wind_dir, wind_speed, sensor_id = sensor
-            pos = self.geo_to_pixel(lon, lat)
+        # Title
+        self.draw_title(ctx)
+
+        # Legend
+        self.draw_legend(ctx)
 
-            # Check for missing data (NaN)
-            is_na = math.isnan(pollution) if pollution is not None else True
+    def _render_static_background(self):
+        """Render the static layers into a full-frame image.
+
+        The layers start with an opaque background fill, so the image is stored
+        without alpha and each frame's blit of it is a straight copy.
+        """
+        ctx = CGBitmapContextCreate(
+            None, self.width, self.height, 8, self.width * 4,
+            self.color_space, self.OPAQUE_BITMAP_INFO
+        )
+        self.draw_static_layers(ctx)
+        return CGBitmapContextCreateImage(ctx)
+
+    def _get_static_background(self):
+        """Get the static layers image (rendered on first use if no base map was loaded)."""
+        with self._static_background_lock:
+            if self._static_background is None:
+                self._static_background = self._render_static_background()
+            return self._static_background
+
+    def draw_frame(self, ctx, frame):
+        """Draw a complete frame into ctx (antialiasing is set up by _get_context)."""
+        # Background, base map, overlays, labels, title and legend in a single blit
+        CGContextDrawImage(ctx, CGRectMake(0, 0, self.width, self.height), self._get_static_background())
+
+        sensors = frame.sensors
+
+        # Methods and colors used for every sensor, bound once per frame
+        create_color = self.create_color
+        draw_label = self.draw_label
+        get_sensor_display_name = self.site_config.get_sensor_display_name
+        name_bg = create_color(1, 1, 1, 0.9)
+        value_bg = create_color(1, 1, 1, 0.85)
+
+        # Positions, sizes and colors for every sensor at once
+        xs, ys, sizes, colors, missing = self.sensor_layout(sensors)
+
+        # Draw sensor circles first, keeping each sensor's placement for the label pass
+        # (labels go in a second pass so no circle is drawn over another sensor's labels).
+        # Largest circles are drawn first so smaller ones stay visible on top; size and
+        # color both follow pollution, so equal colors end up adjacent and the fill and
+        # stroke colors are only set when they change.
+        xs, ys, sizes, colors, missing = xs.tolist(), ys.tolist(), sizes.tolist(), colors.tolist(), missing.tolist()
+        placements = [None] * len(xs)
+        CGContextSetLineWidth(ctx, 4)
+        last_color = None
+        for i in sorted(range(len(xs)), key=lambda k: -sizes[k]):
+            pos = (xs[i], ys[i])
+            size = sizes[i]
+            is_na = missing[i]
 
             if is_na:
-                # Use minimum size and gray color for NA
-                size = self.circle_min
-                color = (0.5, 0.5, 0.5)  # Gray
-                alpha = 0.5
+                # Gray for NA
+                color = (0.5, 0.5, 0.5, 0.5)
             else:
-                size = self.get_circle_size(pollution)
-                color = self.get_plasma_color(pollution)
-                alpha = 0.9
+                color = (*colors[i], 0.9)
 
-            # Main circle
-            CGContextSetFillColorWithColor(ctx, self.create_color(*color, alpha))
+            # Main circle and its border, filled and stroked from one path
+            if color != last_color:
+                CGContextSetFillColorWithColor(ctx, create_color(*color))
+                CGContextSetStrokeColorWithColor(ctx, create_color(*color[:3], min(1.0, color[3] + 0.1)))
+                last_color = color
             CGContextAddEllipseInRect(ctx, CGRectMake(pos[0] - size/2, pos[1] - size/2, size, size))
-            CGContextFillPath(ctx)
+            CGContextDrawPath(ctx, kCGPathFillStroke)
 
-            # Circle border
-            CGContextSetStrokeColorWithColor(ctx, self.create_color(*color, min(1.0, alpha + 0.1)))
-            CGContextSetLineWidth(ctx, 4)
-            CGContextAddEllipseInRect(ctx, CGRectMake(pos[0] - size/2, pos[1] - size/2, size, size))
-            CGContextStrokePath(ctx)
+            placements[i] = (pos, size, is_na)
 
         # Draw labels on circles - with offset for overlapping sensors
-        sensor_positions = [(self.geo_to_pixel(s[0], s[1]), s) for s in frame.sensors]
+        unit = self.pollution_type.unit
+        short_unit = unit.split('/')[0].replace('particles', 'p') + '/' + unit.split('/')[-1] if '/' in unit else unit
+        is_eastie = self.site_config.name == "eastie"
+        pollution_values = sensors.pollution.tolist()
 
-        for i, (pos, sensor) in enumerate(sensor_positions):
-            lon, lat, pollution, wind_dir, wind_speed, sensor_id = sensor
-
-            # Check for missing data (NaN)
-            is_na = math.isnan(pollution) if pollution is not None else True
-            size = self.circle_min if is_na else self.get_circle_size(pollution)
+        for i, (pos, size, is_na) in enumerate(placements):
+            pollution = pollution_values[i]
+            sensor_id = sensors.sensor_ids[i]
 
             # Check if this sensor overlaps with others and calculate offset
             x_offset = 0
             y_offset = 0
-            for j, (other_pos, other_sensor) in enumerate(sensor_positions):
+            for j, (other_pos, _, _) in enumerate(placements):
                 if i != j:
                     dist = math.sqrt((pos[0] - other_pos[0])**2 + (pos[1] - other_pos[1])**2)
                     if dist < 192:  # Sensors are close
@@ -697,14 +950,13 @@ class Renderer:
                             x_offset = 96   # This sensor is to the right, offset label right
 
             # Sensor name and pollution value labels
-            sensor_name = self.site_config.get_sensor_display_name(sensor_id)
+            sensor_name = get_sensor_display_name(sensor_id)
             label_x = pos[0] + x_offset
 
             # Pollution value label (or "NA" if missing)
             if is_na:
                 pollution_label = "NA"
             else:
-                short_unit = self.pollution_type.unit.split('/')[0].replace('particles', 'p') + '/' + self.pollution_type.unit.split('/')[-1] if '/' in self.pollution_type.unit else self.pollution_type.unit
                 if pollution >= 1000:
                     pollution_label = f"{pollution/1000:.1f}K {short_unit}"
                 else:
@@ -712,40 +964,91 @@ class Renderer:
 
             # For Eastie: sensor name at bottom, pollution at top
             # For other sites: both labels above the circle
-            if self.site_config.name == "eastie":
+            if is_eastie:
                 # Pollution at top
-                self.draw_label(ctx, pollution_label, label_x, pos[1] + size/2 + 40,
-                               font_size=23, bold=True, bg_color=self.create_color(1, 1, 1, 0.85))
+                draw_label(ctx, pollution_label, label_x, pos[1] + size/2 + 40,
+                           font_size=23, bold=True, bg_color=value_bg)
                 # Sensor name at bottom
-                self.draw_label(ctx, sensor_name, label_x, pos[1] - size/2 - 40,
-                               font_size=23, bold=True, bg_color=self.create_color(1, 1, 1, 0.9))
+                draw_label(ctx, sensor_name, label_x, pos[1] - size/2 - 40,
+                           font_size=23, bold=True, bg_color=name_bg, cache=True)
             else:
                 # Both above circle (sensor name closer, pollution further up)
-                self.draw_label(ctx, sensor_name, label_x, pos[1] - size/2 - 29,
-                               font_size=23, bold=True, bg_color=self.create_color(1, 1, 1, 0.9))
-                self.draw_label(ctx, pollution_label, label_x, pos[1] - size/2 - 64,
-                               font_size=23, bold=True, bg_color=self.create_color(1, 1, 1, 0.85))
+                draw_label(ctx, sensor_name, label_x, pos[1] - size/2 - 29,
+                           font_size=23, bold=True, bg_color=name_bg, cache=True)
+                draw_label(ctx, pollution_label, label_x, pos[1] - size/2 - 64,
+                           font_size=23, bold=True, bg_color=value_bg)
 
         # Draw wind indicator in center (from weather station)
-        self.draw_wind_indicator(ctx, frame.sensors)
+        self.draw_wind_indicator(ctx, frame.station_wind_dir, frame.station_wind_speed)
 
-        # Title
-        self.draw_title(ctx, frame.date_label, frame.time_label)
+        # Date and time
+        self.draw_subtitle(ctx, frame.date_label, frame.time_label)
 
-        # Legend
-        self.draw_legend(ctx)
+    def save_pixels(self, pixels: np.ndarray, path: str):
+        """Write a rendered BGRA pixel buffer as PNG.
 
-        return CGBitmapContextCreateImage(ctx)
+        Encodes directly from the bitmap memory, skipping the CGImage/ImageIO
+        round trip. Frames are opaque, so premultiplied BGRA equals straight BGRA.
+        Fast deflate suits intermediate frames that only live until video encoding.
+        """
+        image = Image.frombuffer('RGBA', (self.width, self.height), pixels, 'raw', 'BGRA', 0, 1)
+        image.save(path, 'PNG', compress_level=1)
+
+    def _get_process_pool(self, num_workers: int) -> ProcessPoolExecutor:
+        """Get the worker process pool, starting it on first use.
 
-    def save_image(self, image, path: str):
-        url = NSURL.fileURLWithPath_(path)
-        dest = CGImageDestinationCreateWithURL(url, "public.png", 1, None)
-        CGImageDestinationAddImage(dest, image, None)
-        CGImageDestinationFinalize(dest)
+        Each worker builds its own Renderer (and base map) once, then renders
+        frames independently, so drawing isn't serialized on one interpreter.
+        """
+        if self._process_pool is None or self._process_pool_size != num_workers:
+            self.close()
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=num_workers,
+                initializer=_init_worker,
+                initargs=(self.width, self.height, self.site_config, self.pollution_type,
+                          self.base_map_path),
+            )
+            self._process_pool_size = num_workers
+        return self._process_pool
+
+    def close(self):
+        """Shut down the worker processes, if any were started."""
+        if self._process_pool is not None:
+            # Drop queued jobs (e.g. after a streamed encode broke off mid-day)
+            self._process_pool.shutdown(cancel_futures=True)
+            self._process_pool = None
+
+    def _run_in_workers(self, fn, jobs: list, num_workers: int, batch_size: int):
+        """Run fn over batches of jobs in the worker processes, yielding results in order.
+
+        At most two batches per worker are in flight, so results that are
+        waiting to be consumed (e.g. raw frames) stay bounded in memory.
+        """
+        total = len(jobs)
+        executor = self._get_process_pool(num_workers)
+        pending = deque()
+        completed = 0
+
+        def collect():
+            nonlocal completed
+            size, future = pending.popleft()
+            result = future.result()
+            completed += size
+            progress = (completed * 100) // total
+            print(f"\rProgress: {progress}% ({completed}/{total} frames)", end="", flush=True)
+            return result
+
+        for start in range(0, total, batch_size):
+            batch = jobs[start:start + batch_size]
+            pending.append((len(batch), executor.submit(fn, batch)))
+            if len(pending) > 2 * num_workers:
+                yield collect()
+        while pending:
+            yield collect()
 
     def render_all_frames(self, frames: list, output_dir: str, num_workers: int = 8, start_frame: int = 1) -> int:
         """
-        Render all frames in parallel.
+        Render all frames in parallel worker processes.
 
         Returns:
             Next frame number (for sequential numbering across days)
@@ -757,22 +1060,62 @@ class Renderer:
         print(f"\nRendering {total} frames...")
 
         start_time = time.time()
-        completed = [0]
 
-        def render_one(args):
-            i, frame = args
-            image = self.render_frame(frame)
-            frame_num = start_frame + i
-            output_file = output_path / f"frame_{frame_num:05d}.png"
-            self.save_image(image, str(output_file))
-            completed[0] += 1
-            progress = (completed[0] * 100) // total
-            print(f"\rProgress: {progress}% ({completed[0]}/{total} frames)", end="", flush=True)
+        jobs = [
+            (frame, str(output_path / f"frame_{start_frame + i:05d}.png"))
+            for i, frame in enumerate(frames)
+        ]
+        for _ in self._run_in_workers(_render_frame_files, jobs, num_workers, self.FRAMES_PER_JOB):
+            pass
 
-        with ThreadPoolExecutor(max_workers=num_workers) as executor:
-            list(executor.map(render_one, enumerate(frames)))
+        elapsed = time.time() - start_time
+        print(f"\n  Rendered in {elapsed:.1f}s ({total/elapsed:.1f} fps)")
+
+        return start_frame + total
+
+    def stream_frames(self, frames: list, write, num_workers: int = 8, start_frame: int = 1) -> int:
+        """
+        Render all frames in parallel worker processes, passing each frame's raw
+        BGRA pixels to write (e.g. an encoder's stdin) in frame order.
+
+        Returns:
+            Next frame number (for sequential numbering across days)
+        """
+        total = len(frames)
+        print(f"\nStreaming {total} frames...")
+
+        start_time = time.time()
+
+        # One frame per job keeps the number of raw frames held in memory small
+        for batch in self._run_in_workers(_render_frame_pixels, frames, num_workers, 1):
+            for pixels in batch:
+                write(pixels)
 
         elapsed = time.time() - start_time
         print(f"\n  Rendered in {elapsed:.1f}s ({total/elapsed:.1f} fps)")
 
         return start_frame + total
+
+
+# Renderer owned by the current worker process (set by _init_worker)
+_worker_renderer = None
+
+
+def _init_worker(width: int, height: int, site_config: 'SiteConfig',
+                 pollution_type: 'PollutionType', base_map_path: str):
+    """Build this worker process's Renderer."""
+    global _worker_renderer
+    _worker_renderer = Renderer(width, height, site_config, pollution_type, verbose=False)
+    if base_map_path:
+        _worker_renderer.load_base_map(base_map_path)
+
+
+def _render_frame_files(jobs: list) -> int:
+    """Render a batch of (frame, path) jobs in a worker process."""
+    _worker_renderer.render_frames_to_files(jobs)
+    return len(jobs)
+
+
+def _render_frame_pixels(frames: list) -> list:
+    """Render a batch of frames to raw pixels in a worker process."""
+    return [_worker_renderer.render_frame_pixels(frame) for frame in frames]
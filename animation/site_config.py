@@ -6,6 +6,7 @@ rendering pipeline to be used for different monitoring sites (East Boston, ECAGP
 and multiple pollution types per site.
 """
 
+import math
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple
 from collections import namedtuple
@@ -84,7 +85,6 @@ class SiteConfig:
         The extent is rounded so that edges fall on nice values (multiples of coord_label_step).
         This ensures labels can be placed at exact pixel positions with equal margins.
         """
-        import math
         step = self.coord_label_step
 
         if self.hardcoded_extent is not None:
@@ -1,9 +1,33 @@
 import json
+import mmap
 import os
 from pathlib import Path
+import matplotlib
+# Render off-screen; the plot is only ever saved to a file
+matplotlib.use("Agg")
 import matplotlib.pyplot as plt
-from datetime import datetime, timedelta
-from collections import defaultdict
+import numpy as np
+import pandas as pd
+from datetime import timedelta
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+# Takeoff times are binned and plotted in the airport's (KBOS) local time
+LOCAL_TIMEZONE = "America/New_York"
+
+# The only track fields the analysis uses
+FLIGHT_COLUMNS = ["callsign", "timestamp", "altitude"]
 
 """
 data format: 
@@ -34,102 +58,204 @@ data format:
   },
 """
 
-def filter_takeoff_landing(all_data, takeoff_threshold=10000):
+def filter_takeoff_landing(callsigns, timestamps, altitudes, takeoff_threshold=10000):
     """
     Filter callsigns to only include those with both takeoff and landing.
     
     Args:
-        all_data: Dictionary mapping callsign to list of flight entries
+        callsigns: Array of callsigns or integer callsign codes, with each
+            callsign's entries contiguous
+        timestamps: Array of int64 ms timestamps, sorted within each callsign
+        altitudes: Array of float altitudes in feet (NaN where missing)
         takeoff_threshold: Altitude threshold in feet (default: 10000)
     
     Returns:
-        tuple: (takeoff_times, landing_times) dictionaries mapping callsign to timestamp
+        tuple: (callsigns, takeoff_times, landing_times) aligned arrays, one entry
+        per kept callsign (in the form passed in), with int64 ms timestamps
     """
-    takeoff_times = {}
-    landing_times = {}
-    
-    for callsign, entries in all_data.items():
-        takeoff_time = None
-        landing_time = None
-        
-        # Find takeoff (first time altitude >= threshold)
-        for entry in entries:
-            altitude = entry.get("altitude", 0)
-            if altitude is not None and altitude >= takeoff_threshold:
-                takeoff_time = entry["timestamp"]
-                break
-        
-        # Find landing (last time altitude >= threshold, after takeoff)
-        if takeoff_time is not None:
-            # Iterate backwards from the end to find the last time above threshold
-            for entry in reversed(entries):
-                altitude = entry.get("altitude", 0)
-                if altitude is not None and altitude >= takeoff_threshold:
-                    # Make sure landing is after takeoff
-                    if entry["timestamp"] > takeoff_time:
-                        landing_time = entry["timestamp"]
-                    break
-        
-        # Only store if both takeoff and landing are found
-        if takeoff_time is not None and landing_time is not None:
-            takeoff_times[callsign] = takeoff_time
-            landing_times[callsign] = landing_time
-    
-    return takeoff_times, landing_times
+    # Missing altitudes are NaN, which never compare >= threshold; skip the
+    # copies when the caller already dropped lower entries
+    above = altitudes >= takeoff_threshold
+    if not above.all():
+        callsigns = callsigns[above]
+        timestamps = timestamps[above]
+    
+    # Each callsign's above-threshold entries are one contiguous run; takeoff is
+    # the first entry of its run and landing the last. One boundary pass finds
+    # both: each run ends just before the next one starts
+    new_run = np.ones(len(callsigns), dtype=bool)
+    new_run[1:] = callsigns[1:] != callsigns[:-1]
+    starts = np.flatnonzero(new_run)
+    ends = np.empty_like(starts)
+    ends[:-1] = starts[1:] - 1
+    ends[-1:] = len(callsigns) - 1
+    takeoffs = timestamps[starts]
+    landings = timestamps[ends]
+    
+    # Only keep callsigns whose landing is after takeoff
+    keep = landings > takeoffs
+    
+    return callsigns[starts[keep]], takeoffs[keep], landings[keep]
 
 
-def get_data_by_callsign():
-    current_folder = Path(__file__).parent
-    data_folder = current_folder.joinpath("data")
+def read_json_track(path):
+    """Parse a JSON track file from a read-only memory map of it.
+    
+    orjson parses the mapped pages in place, so the file isn't first copied
+    into a bytes object; the stdlib fallback still needs one copy.
+    """
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if HAS_ORJSON:
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+        return json.loads(mm[:])
 
-    # load all data for a given day and merge by callsign
-    all_data = {}
 
-    august_first = data_folder.joinpath("2025-08-01")
-    for day_data in august_first.iterdir():
-        for files in day_data.iterdir():
-            if "json" in files.name:
-                 data = json.loads(files.read_text())
+def read_parquet_track(path):
+    """Read FLIGHT_COLUMNS from a Parquet track file, with timestamps as epoch ms.
+    
+    Works for both a single flight's file and an hour.parquet holding every
+    flight of the hour; only the three columns are read from disk.
+    """
+    track = pd.read_parquet(path, columns=FLIGHT_COLUMNS)
+
+    # Parquet keeps the fetched datetimes; the JSON tracks store epoch milliseconds
+    timestamps = track["timestamp"]
+    if pd.api.types.is_datetime64_any_dtype(timestamps):
+        if timestamps.dt.tz is not None:
+            timestamps = timestamps.dt.tz_convert("UTC").dt.tz_localize(None)
+        track["timestamp"] = timestamps.astype("datetime64[ms]").astype(np.int64)
+
+    return track
+
+
+def load_track_files(day_folder):
+    """Parse every hourly track file (JSON or Parquet) for a day into one DataFrame of FLIGHT_COLUMNS."""
+    # load all JSON data for a given day into one flat list per column; only
+    # the used fields are kept, so each file's full entry dicts are freed as
+    # soon as it has been read
+    callsigns = []
+    timestamps = []
+    altitudes = []
+    tracks = []
 
-                 for entry in data:
-                    callsign = entry["callsign"]
-                    if callsign not in all_data:
-                        all_data[callsign] = []
+    for day_data in os.scandir(day_folder):
+        if not day_data.is_dir():
+            continue
+        for files in os.scandir(day_data.path):
+            if files.name.endswith(".json"):
+                entries = read_json_track(files.path)
+                callsigns.extend([entry.get("callsign") for entry in entries])
+                timestamps.extend([entry["timestamp"] for entry in entries])
+                altitudes.extend([entry.get("altitude") for entry in entries])
+            elif files.name.endswith(".parquet"):
+                tracks.append(read_parquet_track(files.path))
 
-                    all_data[callsign].append(entry)
+    all_data = pd.DataFrame({
+        "callsign": callsigns,
+        "timestamp": np.array(timestamps, dtype=np.int64),
+        # Missing altitudes (None) become NaN
+        "altitude": np.array(altitudes, dtype=np.float64),
+    })
+    if tracks:
+        all_data = pd.concat([all_data, *tracks], ignore_index=True)
+
+    # Dictionary-encode callsigns: each distinct string is stored once and rows
+    # carry small integer codes
+    all_data["callsign"] = all_data["callsign"].astype("category")
+    return all_data
+
+
+def newest_mtime(day_folder):
+    """Latest modification time of a day folder, its hour folders and their files."""
+    newest = os.stat(day_folder).st_mtime
+    for day_data in os.scandir(day_folder):
+        newest = max(newest, day_data.stat().st_mtime)
+        if day_data.is_dir():
+            for files in os.scandir(day_data.path):
+                newest = max(newest, files.stat().st_mtime)
+    return newest
+
+
+def load_day(day_folder):
+    """
+    Load a day's flight entries, cached as Parquet next to the day folder.
     
-    # Sort all entries by timestamp for each callsign
-    for callsign in all_data:
-        all_data[callsign].sort(key=lambda x: x["timestamp"])
+    Parsing the JSON track files dominates a run, so the parsed columns are
+    written to data/<day>.parquet and reused until any track file is newer.
+    Without pyarrow the track files are parsed every time.
+    """
+    cache_path = day_folder.parent.joinpath(f"{day_folder.name}.parquet")
+
+    if HAS_PYARROW and cache_path.exists() and cache_path.stat().st_mtime >= newest_mtime(day_folder):
+        return pq.read_table(cache_path, read_dictionary=["callsign"]).to_pandas()
+
+    all_data = load_track_files(day_folder)
+
+    if HAS_PYARROW:
+        schema = pa.schema([
+            ("callsign", pa.dictionary(pa.int32(), pa.string())),
+            ("timestamp", pa.int64()),
+            ("altitude", pa.float64()),
+        ])
+        table = pa.Table.from_pandas(all_data, schema=schema, preserve_index=False)
+        pq.write_table(table, cache_path, compression="zstd", use_dictionary=["callsign"])
+
+    return all_data
+
+
+def get_data_by_callsign():
+    current_folder = Path(__file__).parent
+    data_folder = current_folder.joinpath("data")
+
+    all_data = load_day(data_folder.joinpath("2025-08-01"))
+    takeoff_threshold = 10000  # feet
+    
+    # Takeoff and landing only depend on entries at or above the threshold, so
+    # drop the rest (and with them callsigns that never get there) before sorting
+    all_data = all_data[all_data["altitude"] >= takeoff_threshold]
+    
+    # One contiguous array per column for the scans below; callsigns only need
+    # to be told apart, so the dictionary codes stand in for them (missing = -1)
+    callsign_codes = all_data["callsign"].cat.codes.to_numpy()
+    timestamps = all_data["timestamp"].to_numpy(dtype=np.int64)
+    altitudes = all_data["altitude"].to_numpy(dtype=np.float64, na_value=np.nan)
+    
+    # Merge by callsign, with each callsign's entries sorted by timestamp, in one
+    # stable lexsort over the integer keys
+    order = np.lexsort((timestamps, callsign_codes))
+    callsign_codes = callsign_codes[order]
+    timestamps = timestamps[order]
+    altitudes = altitudes[order]
     
     # Filter to only callsigns with both takeoff and landing
-    takeoff_threshold = 10000  # feet
-    takeoff_times, landing_times = filter_takeoff_landing(all_data, takeoff_threshold)
+    _, takeoff_times, _ = filter_takeoff_landing(callsign_codes, timestamps, altitudes,
+                                                 takeoff_threshold)
     
     print(f"Found {len(takeoff_times)} callsigns with both takeoff and landing")
     print(f"  (Filtered out callsigns that only had takeoff or only had landing)")
     
-    # Bin takeoff times by minute (using only callsigns with both takeoff and landing)
-    # Convert timestamps to datetime and round to nearest minute
-    takeoff_datetimes = [datetime.fromtimestamp(ts / 1000) for ts in takeoff_times.values()]
+    if len(takeoff_times) == 0:
+        print("No takeoff data to plot after filtering.")
+        return
     
-    # Create minute bins (round down to the minute)
-    minute_bins = defaultdict(int)
-    for dt in takeoff_datetimes:
-        # Round down to the minute (remove seconds and microseconds)
-        minute_key = dt.replace(second=0, microsecond=0)
-        minute_bins[minute_key] += 1
+    # Bin takeoff times by minute (using only callsigns with both takeoff and landing)
+    # Round down to the minute with integer math on the ms timestamps; the local
+    # time zone offset is a whole number of minutes, so bins are the same in UTC
+    minute_index = takeoff_times // 60000
+    first_minute = minute_index.min()
+    counts = np.bincount(minute_index - first_minute)
     
-    # Sort by time for plotting
-    sorted_minutes = sorted(minute_bins.keys())
-    takeoff_counts = [minute_bins[minute] for minute in sorted_minutes]
+    # Keep only minutes with takeoffs, in time order
+    present = np.flatnonzero(counts)
+    takeoff_counts = counts[present]
     
-    if not sorted_minutes:
-        print("No takeoff data to plot after filtering.")
-        return
+    # Convert only those minutes to local datetimes
+    sorted_minutes = (pd.to_datetime((first_minute + present) * 60000, unit="ms", utc=True)
+                      .tz_convert(LOCAL_TIMEZONE).tz_localize(None))
     
     # Create the plot - using bar plot since we have discrete time bins
-    plt.figure(figsize=(14, 6))
+    fig = plt.figure(figsize=(14, 6))
     # Use timedelta for bar width (1 minute)
     bar_width = timedelta(minutes=1)
     plt.bar(sorted_minutes, takeoff_counts, width=bar_width, align='edge', alpha=0.7, color='steelblue')
@@ -144,17 +270,16 @@ def get_data_by_callsign():
     
     # Save the plot
     output_path = current_folder.joinpath("takeoff_count_plot.png")
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
+    plt.savefig(output_path, dpi=150, bbox_inches='tight')
+    plt.close(fig)
     print(f"Plot saved to: {output_path}")
     
     # Print statistics
     print(f"\nTakeoff Statistics (only callsigns with both takeoff and landing):")
     print(f"  Total takeoffs detected: {len(takeoff_times)}")
     print(f"  Time range: {sorted_minutes[0]} to {sorted_minutes[-1]}")
-    print(f"  Max takeoffs in a single minute: {max(takeoff_counts)}")
-    print(f"  Average takeoffs per minute: {sum(takeoff_counts)/len(takeoff_counts):.2f}")
-    
-    plt.show()
+    print(f"  Max takeoffs in a single minute: {takeoff_counts.max()}")
+    print(f"  Average takeoffs per minute: {takeoff_counts.mean():.2f}")
 
 
 if __name__ == '__main__':
@@ -3,17 +3,25 @@
 Fetch arrivals and departures from BOS (Boston Logan Intl)
 using the traffic library and OpenSky's Trino institutional interface.
 
-Loops hourly from 2025-08-01 to 2025-08-13, creating folder structure:
+Fetches every hour from 2025-08-01 to 2025-08-13, several hours at a time,
+creating folder structure:
     data/YYYY-MM-DD/HH-HH/
-Each file corresponds to one aircraft's ADS-B track for that hour.
+Each hour folder holds one zstd-compressed hour.parquet with every aircraft's
+ADS-B track for that hour, told apart by its callsign column.
 """
 
 import os
 import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 import pandas as pd
 from traffic.data import opensky
 
+# Per-flight messages are DEBUG; set level=logging.DEBUG to see them
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger(__name__)
+
 # --- Configuration ---
 airport = "KBOS"
 username = os.environ["OPENSKY_USERNAME"]
@@ -22,12 +30,15 @@ password = os.environ["OPENSKY_PASSWORD"]
 start_date = datetime(2025, 8, 1, 0, 0)
 end_date   = datetime(2025, 8, 13, 0, 0)
 
-# --- Loop through every hour ---
-current = start_date
-while current < end_date:
+# Hourly queries in flight at once; each one mostly waits on the Trino server
+max_workers = 8
+
+
+def fetch_hour(current):
+    """Fetch one hour of flights and save each aircraft's track."""
     next_hour = current + timedelta(hours=1)
 
-    print(f"\n=== Fetching flights from {current} to {next_hour} ===")
+    logger.info(f"=== Fetching flights from {current} to {next_hour} ===")
 
     try:
         traffic = opensky.history(
@@ -40,11 +51,10 @@ while current < end_date:
             limit=None,
         )
     except Exception as e:
-        print(f"⚠️ Error fetching {current}: {e}")
-        current = next_hour
-        continue
+        logger.warning(f"⚠️ Error fetching {current}: {e}")
+        return
 
-    print(f"Fetched {len(traffic)} flights.")
+    logger.info(f"Fetched {len(traffic)} flights for {current}.")
 
     # --- Create folder structure ---
     day_folder = current.strftime("data/%Y-%m-%d")
@@ -52,23 +62,37 @@ while current < end_date:
     os.makedirs(hour_folder, exist_ok=True)
 
     # --- Loop over flights ---
+    tracks = []
     for f in traffic:
         callsign = (f.callsign or f.icao24 or "UNKNOWN").strip()
-        safe_name = callsign.replace("/", "_").replace(" ", "_")
 
         if f.data is None or f.data.empty:
-            print(f"Skipping {callsign}: no data")
+            logger.debug(f"Skipping {callsign}: no data")
             continue
 
-        # --- Save raw data ---
-        csv_path = os.path.join(hour_folder, f"{safe_name}.csv")
-        f.data.to_csv(csv_path, index=False)
+        tracks.append(f.data.assign(callsign=callsign))
 
-        json_path = os.path.join(hour_folder, f"{safe_name}.json")
-        f.data.to_json(json_path, orient="records", indent=2)
+    if not tracks:
+        return
 
-        print(f"Saved {callsign} → {csv_path}")
+    # --- Save raw data: one file per hour instead of one per flight ---
+    parquet_path = os.path.join(hour_folder, "hour.parquet")
+    pd.concat(tracks, ignore_index=True).to_parquet(
+        parquet_path, compression="zstd", index=False, row_group_size=100_000
+    )
+
+    logger.info(f"Saved {len(tracks)} flights → {parquet_path}")
+
+
+# --- Fetch every hour, several at once ---
+hours = []
+current = start_date
+while current < end_date:
+    hours.append(current)
+    current += timedelta(hours=1)
 
-    current = next_hour  # move to next hour
+with ThreadPoolExecutor(max_workers=max_workers) as executor:
+    # Each hour writes to its own folder, so the tasks are independent
+    list(executor.map(fetch_hour, hours))
 
-print("\n✅ All done! Data saved in ./data/")
+logger.info("✅ All done! Data saved in ./data/")